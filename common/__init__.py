@@ -2,7 +2,7 @@
 Common utilities shared across all components
 """
 
-from .logging import configure_logging, get_logger
+from .logging import PROD, configure_logging, get_logger
 
-__all__ = ["configure_logging", "get_logger"]
+__all__ = ["PROD", "configure_logging", "get_logger"]
 
@@ -4,7 +4,9 @@ Enterprise-grade logging setup
 """
 
 import logging
+import os
 import sys
+import orjson
 import structlog
 from typing import Any
 
@@ -16,13 +18,25 @@ def configure_logging(log_level: str = "INFO") -> None:
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
+    level = getattr(logging, log_level.upper())
+    
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper())
+        level=level
     )
     
+    # Production renders JSON with orjson, which returns bytes; hand those
+    # straight to a bytes logger. Development renders str for the console and
+    # writes it directly to the stream rather than going through print()
+    if PROD:
+        renderer = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        logger_factory = structlog.BytesLoggerFactory()
+    else:
+        renderer = structlog.dev.ConsoleRenderer()
+        logger_factory = structlog.WriteLoggerFactory()
+    
     # Configure structlog
     structlog.configure(
         processors=[
@@ -32,23 +46,25 @@ def configure_logging(log_level: str = "INFO") -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if _is_production() else structlog.dev.ConsoleRenderer()
+            renderer
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper())
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
 def _is_production() -> bool:
     """Check if running in production environment"""
-    import os
     return os.getenv("ENVIRONMENT", "development").lower() == "production"
 
 
+# Resolved once at import so configure_logging and hot paths can skip
+# dev-only work without repeated environment lookups
+PROD: bool = _is_production()
+
+
 def get_logger(name: str = None) -> structlog.BoundLogger:
     """
     Get a configured logger instance
@@ -5,20 +5,269 @@ Generates all synthetic healthcare claims data
 
 import argparse
 import csv
-import json
+import io
+import operator
+import os
+import platform
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, get_args
+
+import msgspec
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 from .generators.patient_generator import PatientGenerator
 from .generators.provider_generator import ProviderGenerator
 from .generators.claim_generator import ClaimGenerator
 from .generators.note_generator import NoteGenerator
 from .generators.lookup_generator import ICD10Generator, CPTGenerator
-from .schemas import (
-    PatientSchema, ProviderSchema, ClaimSchema, NoteSchema,
-    ICD10Schema, CPTSchema
-)
+from .schemas import ClaimRecord, PatientRecord, arrow_schema, schema_fields
+
+# Number of records serialized per CSV write
+EXPORT_BATCH_SIZE = 1000
+# Encoded CSV bytes accumulated before they are written out
+EXPORT_BUFFER_SIZE = 1 << 20
+# Pending buffers are submitted with a single writev() on Linux
+USE_WRITEV = platform.system() == 'Linux' and hasattr(os, 'writev')
+# Most buffers a single writev() call accepts
+WRITEV_MAX_BUFFERS = 1024
+# Flushes that may wait for the writer thread before serialization blocks
+EXPORT_QUEUE_SIZE = 8
+# Rows per batch inside Arrow's CSV writer
+ARROW_CSV_BATCH_SIZE = 8192
+
+# Output file for each generated dataset
+EXPORT_FILES = {
+    'icd10': 'raw_icd10.csv',
+    'cpt': 'raw_cpt.csv',
+    'patients': 'raw_patients.csv',
+    'providers': 'raw_providers.csv',
+    'claims': 'raw_claims.csv',
+    'notes': 'raw_notes.csv',
+}
+
+
+def _batched(records: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of up to `size` records"""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _writev_all(fd: int, buffers: List[bytes]) -> None:
+    """Write every buffer to fd with as few writev() calls as possible"""
+    views = [memoryview(buffer) for buffer in buffers]
+    start = 0
+    while start < len(views):
+        written = os.writev(fd, views[start:start + WRITEV_MAX_BUFFERS])
+        # Skip the buffers that went out whole, then trim a partial one
+        while start < len(views) and written >= len(views[start]):
+            written -= len(views[start])
+            start += 1
+        if written:
+            views[start] = views[start][written:]
+
+
+def _is_temporal(annotation) -> bool:
+    """Whether a field annotation is a date/datetime (optionally wrapped in Optional)"""
+    return any(
+        isinstance(t, type) and issubclass(t, date)
+        for t in (annotation, *get_args(annotation))
+    )
+
+
+class CsvBatchWriter:
+    """
+    Streams Pydantic schemas or msgspec records to a CSV file in fixed-size batches
+    
+    msgspec records are converted a whole batch at a time with
+    msgspec.to_builtins; Pydantic rows are read positionally with an
+    attrgetter over the schema fields instead of going through .dict().
+    Each batch is serialized to bytes in memory, and roughly
+    EXPORT_BUFFER_SIZE bytes at a time are handed to a background thread
+    that writes them (one writev() on Linux), so serialization overlaps
+    with disk I/O. The bounded queue between them keeps memory flat if
+    the disk falls behind. The file is created on the first batch, so an
+    empty stream writes nothing.
+    """
+    
+    def __init__(self, filepath: Path, batch_size: int = EXPORT_BATCH_SIZE):
+        self.filepath = filepath
+        self.batch_size = batch_size
+        self.count = 0
+        self._file = None
+        self._text = io.StringIO(newline='')
+        self._writer = csv.writer(self._text)
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._getter = None
+        self._temporal_columns = ()
+        self._is_struct = False
+    
+    def __enter__(self) -> "CsvBatchWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _open(self, schema: type) -> None:
+        """Create the file and resolve the column layout from the schema class"""
+        annotations = dict(schema_fields(schema))
+        fields = tuple(annotations)
+        self._is_struct = issubclass(schema, msgspec.Struct)
+        # attrgetter with several names returns a tuple in field order
+        self._getter = operator.attrgetter(*fields) if len(fields) > 1 else (
+            lambda item, name=fields[0]: (getattr(item, name),)
+        )
+        self._temporal_columns = tuple(
+            i for i, name in enumerate(fields)
+            if _is_temporal(annotations[name])
+        )
+        # writev() goes straight to the descriptor, so it needs an unbuffered file
+        self._file = open(self.filepath, 'wb', buffering=0 if USE_WRITEV else -1)
+        self._thread = threading.Thread(
+            target=self._drain, name=f"csv-writer-{self.filepath.name}", daemon=True
+        )
+        self._thread.start()
+        self._writer.writerow(fields)
+    
+    def _drain(self) -> None:
+        """Writer thread: write queued buffers until the None sentinel arrives"""
+        while True:
+            buffers = self._queue.get()
+            if buffers is None:
+                return
+            if self._error is not None:
+                # Keep draining so the producer never blocks on a dead writer
+                continue
+            try:
+                if USE_WRITEV:
+                    _writev_all(self._file.fileno(), buffers)
+                else:
+                    self._file.write(b''.join(buffers))
+            except BaseException as exc:
+                self._error = exc
+    
+    def _serialize(self, rows: list) -> None:
+        """Encode rows as CSV and queue the bytes for writing"""
+        text = self._text
+        self._writer.writerows(rows)
+        data = text.getvalue().encode('utf-8')
+        text.seek(0)
+        text.truncate()
+        
+        self._pending.append(data)
+        self._pending_size += len(data)
+        self.count += len(rows)
+        if self._pending_size >= EXPORT_BUFFER_SIZE:
+            self._flush()
+    
+    def _flush(self) -> None:
+        """Hand the pending buffers to the writer thread"""
+        if self._error is not None:
+            raise self._error
+        buffers = self._pending
+        if not buffers:
+            return
+        self._pending = []
+        self._pending_size = 0
+        self._queue.put(buffers)
+    
+    def _write_chunk(self, chunk: list) -> None:
+        if self._file is None:
+            self._open(type(chunk[0]))
+        
+        if self._is_struct:
+            # array_like structs come back as lists, with dates as ISO strings
+            self._serialize(msgspec.to_builtins(chunk))
+            return
+        
+        getter = self._getter
+        temporal_columns = self._temporal_columns
+        rows = []
+        for item in chunk:
+            row = list(getter(item))
+            # Convert dates/datetimes to strings
+            for i in temporal_columns:
+                value = row[i]
+                if value is not None:
+                    row[i] = value.isoformat()
+            rows.append(row)
+        
+        self._serialize(rows)
+    
+    def write(self, records: Iterable) -> None:
+        """Consume records, writing them in batches"""
+        for chunk in _batched(records, self.batch_size):
+            self._write_chunk(chunk)
+    
+    def write_through(self, records: Iterable) -> Iterator:
+        """Write records in batches, yielding each record once its batch is written"""
+        for chunk in _batched(records, self.batch_size):
+            self._write_chunk(chunk)
+            yield from chunk
+    
+    def close(self) -> None:
+        if self._file is not None:
+            try:
+                self._flush()
+            finally:
+                self._queue.put(None)
+                self._thread.join()
+                self._file.close()
+                self._file = None
+            if self._error is not None:
+                raise self._error
+
+
+class ArrowCsvWriter:
+    """
+    Streams columnar batches to a CSV file with Arrow's C++ CSV writer
+    
+    Used where a generator already produces columns, so no per-cell Python
+    formatting happens. The file is created on the first batch.
+    """
+    
+    def __init__(self, filepath: Path, schema: pa.Schema):
+        self.filepath = filepath
+        self.schema = schema
+        self.count = 0
+        self._writer = None
+    
+    def __enter__(self) -> "ArrowCsvWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def write(self, columns: Dict[str, np.ndarray]) -> None:
+        table = pa.Table.from_pydict(columns, schema=self.schema)
+        if self._writer is None:
+            self._writer = pa_csv.CSVWriter(
+                str(self.filepath),
+                self.schema,
+                write_options=pa_csv.WriteOptions(batch_size=ARROW_CSV_BATCH_SIZE)
+            )
+        self._writer.write_table(table)
+        self.count += table.num_rows
+    
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
 
 
 class DataGenerator:
@@ -37,120 +286,143 @@ class DataGenerator:
         self.icd10_gen = ICD10Generator(seed=seed)
         self.cpt_gen = CPTGenerator(seed=seed)
         
-        self.generated_data: Dict[str, List] = {}
+        # Records are streamed straight to CSV; only counts and the
+        # lookup codes needed by downstream generators are retained
+        self.counts: Dict[str, int] = {}
+        self.icd10_codes: List[str] = []
+        self.cpt_codes: List[str] = []
+    
+    def _export_records(self, key: str, records: Iterable) -> Iterator:
+        """Stream records to the dataset's CSV, yielding each one after it has been written"""
+        with CsvBatchWriter(self.output_dir / EXPORT_FILES[key]) as writer:
+            yield from writer.write_through(records)
+        self.counts[key] = writer.count
+    
+    def _export_columns(self, key: str, schema: type, batches: Iterable[dict]) -> Iterator[dict]:
+        """Stream columnar batches to the dataset's CSV, yielding each batch after it has been written"""
+        with ArrowCsvWriter(self.output_dir / EXPORT_FILES[key], arrow_schema(schema)) as writer:
+            for columns in batches:
+                writer.write(columns)
+                yield columns
+        self.counts[key] = writer.count
+    
+    def _print_exported(self, *keys: str) -> None:
+        for key in keys:
+            print(f"  ✓ Exported {self.counts.get(key, 0)} records to {EXPORT_FILES[key]}")
+    
+    def _load_lookup_codes(self) -> None:
+        """Populate the diagnosis/procedure codes used by the claim generator"""
+        if not self.icd10_codes:
+            self.icd10_codes = [code.code for code in self.icd10_gen.generate_icd10_lookup()]
+        if not self.cpt_codes:
+            self.cpt_codes = [code.code for code in self.cpt_gen.generate_cpt_lookup()]
     
     def generate_lookup_tables(self):
-        """Generate ICD-10 and CPT lookup tables"""
+        """Generate ICD-10 and CPT lookup tables and export them to CSV"""
         print("Generating lookup tables...")
         
         icd10_codes = self.icd10_gen.generate_icd10_lookup()
         cpt_codes = self.cpt_gen.generate_cpt_lookup()
         
-        self.generated_data['icd10'] = icd10_codes
-        self.generated_data['cpt'] = cpt_codes
+        self.icd10_codes = [code.code for code in self._export_records('icd10', icd10_codes)]
+        self.cpt_codes = [code.code for code in self._export_records('cpt', cpt_codes)]
+        self._print_exported('icd10', 'cpt')
         
         print(f"  ✓ Generated {len(icd10_codes)} ICD-10 codes")
         print(f"  ✓ Generated {len(cpt_codes)} CPT codes")
         
         return icd10_codes, cpt_codes
     
+    def _export_patients(self, num_patients: int) -> None:
+        batches = self.patient_gen.iter_patient_columns(num_patients)
+        for _ in self._export_columns('patients', PatientRecord, batches):
+            pass
+    
+    def _export_providers(self, num_providers: int) -> None:
+        providers = self.provider_gen.iter_providers(num_providers)
+        for _ in self._export_records('providers', providers):
+            pass
+    
+    def _export_claims(
+        self,
+        num_patients: int,
+        num_providers: int,
+        claims_per_patient: int,
+        notes_per_claim: int
+    ) -> None:
+        """Generate claims and their notes together: each batch of claims is
+        written out and then handed to the note generator"""
+        self._load_lookup_codes()
+        batches = self.claim_gen.iter_claim_columns(
+            patient_ids=self.patient_gen.patient_ids(num_patients),
+            provider_ids=self.provider_gen.provider_ids(num_providers),
+            diagnosis_codes=self.icd10_codes,
+            procedure_codes=self.cpt_codes,
+            claims_per_patient=claims_per_patient
+        )
+        # Claims are written straight from the sampled columns; records
+        # are only built because the note generator needs them
+        claims = (
+            claim
+            for columns in self._export_columns('claims', ClaimRecord, batches)
+            for claim in self.claim_gen.claims_from_columns(columns)
+        )
+        notes = self.note_gen.iter_notes(claims, notes_per_claim=notes_per_claim)
+        for _ in self._export_records('notes', notes):
+            pass
+    
     def generate_core_data(
         self,
         num_patients: int = 1000,
         num_providers: int = 100,
         claims_per_patient: int = 3,
-        notes_per_claim: int = 1
+        notes_per_claim: int = 1,
+        workers: Optional[int] = None
     ):
-        """Generate patients, providers, and claims"""
+        """
+        Generate patients, providers, claims and notes, streaming each to CSV
+        
+        Patients, providers and claims (with their notes) only share
+        deterministic IDs, so they are produced by independent export jobs
+        running in separate processes.
+        
+        Args:
+            workers: Number of worker processes (default: one per job;
+                1 runs every job in this process)
+        """
         print(f"\nGenerating core data...")
         print(f"  Patients: {num_patients}")
         print(f"  Providers: {num_providers}")
         print(f"  Claims per patient: {claims_per_patient}")
         print(f"  Notes per claim: {notes_per_claim}")
         
-        # Generate patients
-        print("\nGenerating patients...")
-        patients = self.patient_gen.generate_patients(num_patients)
-        self.generated_data['patients'] = patients
-        print(f"  ✓ Generated {len(patients)} patients")
-        
-        # Generate providers
-        print("\nGenerating providers...")
-        providers = self.provider_gen.generate_providers(num_providers)
-        self.generated_data['providers'] = providers
-        print(f"  ✓ Generated {len(providers)} providers")
-        
-        # Get diagnosis and procedure codes
-        icd10_codes = [code.code for code in self.generated_data['icd10']]
-        cpt_codes = [code.code for code in self.generated_data['cpt']]
-        
-        # Generate claims
-        print("\nGenerating claims...")
-        claims = self.claim_gen.generate_claims(
-            patients=patients,
-            providers=providers,
-            diagnosis_codes=icd10_codes,
-            procedure_codes=cpt_codes,
-            claims_per_patient=claims_per_patient
-        )
-        self.generated_data['claims'] = claims
-        print(f"  ✓ Generated {len(claims)} claims")
-        
-        # Generate notes
-        print("\nGenerating clinical notes...")
-        notes = self.note_gen.generate_notes(claims, notes_per_claim=notes_per_claim)
-        self.generated_data['notes'] = notes
-        print(f"  ✓ Generated {len(notes)} clinical notes")
-        
-        return patients, providers, claims, notes
-    
-    def export_to_csv(self):
-        """Export all data to CSV files"""
-        print("\nExporting data to CSV files...")
-        
-        # Export lookup tables
-        self._export_schema_list('icd10', 'raw_icd10.csv')
-        self._export_schema_list('cpt', 'raw_cpt.csv')
-        
-        # Export core data
-        self._export_schema_list('patients', 'raw_patients.csv')
-        self._export_schema_list('providers', 'raw_providers.csv')
-        self._export_schema_list('claims', 'raw_claims.csv')
-        self._export_schema_list('notes', 'raw_notes.csv')
-        
-        print("  ✓ All data exported to CSV")
-    
-    def _export_schema_list(self, key: str, filename: str):
-        """Export a list of Pydantic schemas to CSV"""
-        if key not in self.generated_data:
-            return
-        
-        data = self.generated_data[key]
-        if not data:
-            return
-        
-        filepath = self.output_dir / filename
-        
-        # Get field names from first schema
-        field_names = list(data[0].dict().keys())
+        jobs = [
+            (self.seed, self.output_dir, 'patients', {'num_patients': num_patients}),
+            (self.seed, self.output_dir, 'providers', {'num_providers': num_providers}),
+            (self.seed, self.output_dir, 'claims', {
+                'num_patients': num_patients,
+                'num_providers': num_providers,
+                'claims_per_patient': claims_per_patient,
+                'notes_per_claim': notes_per_claim,
+            }),
+        ]
+        if workers is None:
+            workers = min(len(jobs), os.cpu_count() or 1)
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=field_names)
-            writer.writeheader()
-            
-            for item in data:
-                # Convert dates/datetimes to strings
-                row = {}
-                for field, value in item.dict().items():
-                    if isinstance(value, (datetime,)):
-                        row[field] = value.isoformat()
-                    elif hasattr(value, 'isoformat'):  # date objects
-                        row[field] = value.isoformat()
-                    else:
-                        row[field] = value
-                writer.writerow(row)
+        print(f"\nGenerating patients, providers, claims and clinical notes ({workers} worker(s))...")
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_export_worker, jobs))
+        else:
+            results = [_export_worker(job) for job in jobs]
+        for counts in results:
+            self.counts.update(counts)
         
-        print(f"  ✓ Exported {len(data)} records to {filename}")
+        self._print_exported('patients', 'providers', 'claims', 'notes')
+        print(f"  ✓ Generated {self.counts.get('patients', 0)} patients")
+        print(f"  ✓ Generated {self.counts.get('providers', 0)} providers")
+        print(f"  ✓ Generated {self.counts.get('claims', 0)} claims")
+        print(f"  ✓ Generated {self.counts.get('notes', 0)} clinical notes")
     
     def export_metadata(self):
         """Export generation metadata"""
@@ -158,18 +430,17 @@ class DataGenerator:
             'generation_date': datetime.now().isoformat(),
             'seed': self.seed,
             'counts': {
-                'patients': len(self.generated_data.get('patients', [])),
-                'providers': len(self.generated_data.get('providers', [])),
-                'claims': len(self.generated_data.get('claims', [])),
-                'notes': len(self.generated_data.get('notes', [])),
-                'icd10_codes': len(self.generated_data.get('icd10', [])),
-                'cpt_codes': len(self.generated_data.get('cpt', []))
+                'patients': self.counts.get('patients', 0),
+                'providers': self.counts.get('providers', 0),
+                'claims': self.counts.get('claims', 0),
+                'notes': self.counts.get('notes', 0),
+                'icd10_codes': self.counts.get('icd10', 0),
+                'cpt_codes': self.counts.get('cpt', 0)
             }
         }
         
         metadata_path = self.output_dir / 'generation_metadata.json'
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
         
         print(f"\n✓ Metadata exported to {metadata_path}")
     
@@ -178,7 +449,8 @@ class DataGenerator:
         num_patients: int = 1000,
         num_providers: int = 100,
         claims_per_patient: int = 3,
-        notes_per_claim: int = 1
+        notes_per_claim: int = 1,
+        workers: Optional[int] = None
     ):
         """Generate all data"""
         print("=" * 60)
@@ -188,11 +460,8 @@ class DataGenerator:
         # Generate lookup tables first
         self.generate_lookup_tables()
         
-        # Generate core data
-        self.generate_core_data(num_patients, num_providers, claims_per_patient, notes_per_claim)
-        
-        # Export to CSV
-        self.export_to_csv()
+        # Generate core data (streamed to CSV as it is produced)
+        self.generate_core_data(num_patients, num_providers, claims_per_patient, notes_per_claim, workers)
         
         # Export metadata
         self.export_metadata()
@@ -206,6 +475,23 @@ class DataGenerator:
             print(f"  - {file.name}")
 
 
+def _export_worker(job: tuple) -> Dict[str, int]:
+    """
+    Run one export job in a fresh DataGenerator
+    
+    Module-level so it can be pickled for ProcessPoolExecutor. Every job
+    seeds its own generators, so output does not depend on the number of
+    workers or on scheduling order.
+    
+    Returns:
+        Record counts for the datasets the job exported
+    """
+    seed, output_dir, stage, kwargs = job
+    generator = DataGenerator(seed=seed, output_dir=output_dir)
+    getattr(generator, f"_export_{stage}")(**kwargs)
+    return generator.counts
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate synthetic healthcare claims data'
@@ -246,6 +532,12 @@ def main():
         default='data/raw',
         help='Output directory for generated files (default: data/raw)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for export jobs (default: one per job, 1 disables parallelism)'
+    )
     
     args = parser.parse_args()
     
@@ -254,7 +546,8 @@ def main():
         num_patients=args.patients,
         num_providers=args.providers,
         claims_per_patient=args.claims_per_patient,
-        notes_per_claim=args.notes_per_claim
+        notes_per_claim=args.notes_per_claim,
+        workers=args.workers
     )
 
 
@@ -3,22 +3,29 @@ Claim data generator
 Generates healthcare claims with realistic patterns
 """
 
-from datetime import date, timedelta
-from typing import List, Optional
+from bisect import bisect
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Sequence
 import random
-from faker import Faker
+import msgspec
+import numpy as np
+import pyarrow as pa
 
-from ingestion.schemas import ClaimSchema, PatientSchema, ProviderSchema
+from ingestion.schemas import ClaimRecord, PatientRecord, ProviderSchema, arrow_schema
 
 
 class ClaimGenerator:
     """Generate synthetic healthcare claim data with coherent relationships"""
     
+    # Low-cardinality columns, dictionary-encoded on the Arrow path
+    CATEGORICAL_FIELDS = ('claim_type', 'claim_status', 'denial_reason')
+    
     def __init__(self, seed: int = None):
-        self.fake = Faker()
         if seed:
-            Faker.seed(seed)
             random.seed(seed)
+        self.rng = np.random.default_rng(seed)
+        self._today = date.today()
         
         # Coherence mappings for logical denial reasons
         self.diagnosis_denial_map = {
@@ -40,6 +47,11 @@ class ClaimGenerator:
             'PHYSICIAN': ['NOT_MEDICALLY_NECESSARY', 'INSUFFICIENT_INFO'],
             'AMBULATORY': ['AUTHORIZATION_REQUIRED', 'PRE_AUTH_REQUIRED'],
         }
+        self.default_denial_reasons = ['INSUFFICIENT_INFO', 'NOT_MEDICALLY_NECESSARY']
+        
+        # Denial likelihood drivers
+        self.high_cost_claim_types = ['INPATIENT', 'AMBULATORY']
+        self.high_risk_diagnoses = ['E11.9', 'M54.5', 'F41.9', 'F32.9']
         
         # Claim type distribution
         self.claim_type_weights = {
@@ -58,6 +70,13 @@ class ClaimGenerator:
             'PENDING': 0.04,
             'REJECTED': 0.01
         }
+        self.non_denied_weights = {'APPROVED': 0.80, 'PARTIAL': 0.10, 'PENDING': 0.08, 'REJECTED': 0.02}
+        
+        # Paid fraction of total charge by status
+        self.paid_ranges = {
+            'APPROVED': (0.70, 0.95),
+            'PARTIAL': (0.30, 0.60),
+        }
         
         # Charge amount ranges by claim type (in USD)
         self.charge_ranges = {
@@ -67,30 +86,93 @@ class ClaimGenerator:
             'PHYSICIAN': (100, 2000),
             'AMBULATORY': (300, 4000)
         }
+        
+        # Precomputed sampling tables so generate_claim does no per-call list/set building
+        self._type_keys = tuple(self.claim_type_weights)
+        self._type_cum = tuple(accumulate(self.claim_type_weights.values()))
+        self._non_denied_keys = tuple(self.non_denied_weights)
+        self._non_denied_cum = tuple(accumulate(self.non_denied_weights.values()))
+        self._denial_reasons = {
+            (diag, ctype): tuple(self._candidate_reasons(diag, ctype))
+            for diag in self.diagnosis_denial_map
+            for ctype in self.claim_type_denial_map
+        }
+        # Diagnoses outside diagnosis_denial_map fall back to the default reasons
+        self._default_reasons = {
+            ctype: tuple(self._candidate_reasons(None, ctype))
+            for ctype in self.claim_type_denial_map
+        }
+        
+        # Lookup tables for batch sampling, indexed by integer claim type / status code
+        self._claim_types = list(self._type_keys)
+        type_weights = np.array(list(self.claim_type_weights.values()))
+        self._claim_type_p = type_weights / type_weights.sum()
+        self._charge_lo = np.array([self.charge_ranges[t][0] for t in self._claim_types], dtype=float)
+        self._charge_hi = np.array([self.charge_ranges[t][1] for t in self._claim_types], dtype=float)
+        self._high_cost_type = np.isin(self._claim_types, self.high_cost_claim_types)
+        self._inpatient_code = self._claim_types.index('INPATIENT')
+        self._emergency_code = self._claim_types.index('EMERGENCY')
+        
+        self._statuses = list(self.non_denied_weights) + ['DENIED']
+        status_weights = np.array(list(self.non_denied_weights.values()))
+        self._non_denied_p = status_weights / status_weights.sum()
+        self._non_denied_cdf = np.cumsum(self._non_denied_p)
+        self._non_denied_cdf /= self._non_denied_cdf[-1]
+        self._denied_code = len(self._statuses) - 1
+        self._paid_lo = np.array([self.paid_ranges.get(s, (0.0, 0.0))[0] for s in self._statuses])
+        self._paid_hi = np.array([self.paid_ranges.get(s, (0.0, 0.0))[1] for s in self._statuses])
+    
+    def _candidate_reasons(self, diagnosis_code: str, claim_type: str) -> List[str]:
+        """Denial reasons consistent with both the diagnosis and the claim type"""
+        diag_reasons = self.diagnosis_denial_map.get(diagnosis_code, self.default_denial_reasons)
+        type_reasons = self.claim_type_denial_map.get(claim_type, self.default_denial_reasons)
+        return [r for r in diag_reasons if r in type_reasons] or diag_reasons
+    
+    def _reasons_for(self, diagnosis_code: str, claim_type: str) -> tuple:
+        """Precomputed candidate denial reasons for a (diagnosis, claim type) pair"""
+        reasons = self._denial_reasons.get((diagnosis_code, claim_type))
+        return reasons if reasons is not None else self._default_reasons[claim_type]
+    
+    def _diagnosis_tables(self, diagnosis_codes: Sequence[str]):
+        """
+        Per-diagnosis lookup tables for the batch path, indexed by position
+        in diagnosis_codes (and claim type code)
+        
+        Candidate denial reasons for every (diagnosis, claim type) pair are
+        padded into an object array so a reason can be picked with one
+        fancy-indexing operation instead of a per-claim lookup.
+        
+        Returns:
+            (reasons[diag, type, k], counts[diag, type], high_risk[diag])
+        """
+        table = [[self._reasons_for(d, t) for t in self._claim_types] for d in diagnosis_codes]
+        width = max((len(reasons) for row in table for reasons in row), default=1)
+        reasons = np.empty((len(diagnosis_codes), len(self._claim_types), width), dtype=object)
+        counts = np.zeros((len(diagnosis_codes), len(self._claim_types)), dtype=np.int64)
+        for i, row in enumerate(table):
+            for j, candidates in enumerate(row):
+                reasons[i, j, :len(candidates)] = candidates
+                counts[i, j] = len(candidates)
+        high_risk = np.isin(diagnosis_codes, self.high_risk_diagnoses)
+        return reasons, counts, high_risk
     
     def generate_claim(
         self,
         claim_id: str,
-        patient: PatientSchema,
+        patient: PatientRecord,
         provider: ProviderSchema,
         diagnosis_code: str,
         procedure_code: Optional[str] = None,
         claim_date: Optional[date] = None
-    ) -> ClaimSchema:
+    ) -> ClaimRecord:
         """Generate a single claim record"""
         
         # Generate claim date (within last 2 years)
         if claim_date is None:
-            claim_date = self.fake.date_between(
-                start_date='-2y',
-                end_date='today'
-            )
+            claim_date = self._today - timedelta(days=random.randint(0, 730))
         
         # Select claim type
-        claim_type = random.choices(
-            list(self.claim_type_weights.keys()),
-            weights=list(self.claim_type_weights.values())
-        )[0]
+        claim_type = self._type_keys[bisect(self._type_cum, random.random() * self._type_cum[-1])]
         
         # Generate admission/discharge dates for inpatient
         admission_date = None
@@ -107,9 +189,9 @@ class ClaimGenerator:
         
         # Determine if claim should be denied (coherent logic)
         should_deny = False
-        if total_charge > 10000 and claim_type in ['INPATIENT', 'AMBULATORY']:
+        if total_charge > 10000 and claim_type in self.high_cost_claim_types:
             should_deny = random.random() < 0.25
-        elif diagnosis_code in ['E11.9', 'M54.5', 'F41.9', 'F32.9']:
+        elif diagnosis_code in self.high_risk_diagnoses:
             should_deny = random.random() < 0.20
         elif claim_type == 'EMERGENCY':
             should_deny = random.random() < 0.05
@@ -119,14 +201,12 @@ class ClaimGenerator:
         # Generate status with coherent denial reasons
         if should_deny:
             # Get contextually appropriate denial reason
-            diag_reasons = self.diagnosis_denial_map.get(diagnosis_code, ['INSUFFICIENT_INFO', 'NOT_MEDICALLY_NECESSARY'])
-            type_reasons = self.claim_type_denial_map.get(claim_type, ['INSUFFICIENT_INFO', 'NOT_MEDICALLY_NECESSARY'])
-            candidate_reasons = list(set(diag_reasons) & set(type_reasons)) or diag_reasons
-            denial_reason = random.choice(candidate_reasons)
+            denial_reason = random.choice(self._reasons_for(diagnosis_code, claim_type))
             claim_status = 'DENIED'
         else:
-            non_denied_weights = {'APPROVED': 0.80, 'PARTIAL': 0.10, 'PENDING': 0.08, 'REJECTED': 0.02}
-            claim_status = random.choices(list(non_denied_weights.keys()), weights=list(non_denied_weights.values()))[0]
+            claim_status = self._non_denied_keys[
+                bisect(self._non_denied_cum, random.random() * self._non_denied_cum[-1])
+            ]
             denial_reason = None
         
         # Calculate paid amount based on status
@@ -145,7 +225,7 @@ class ClaimGenerator:
         else:  # REJECTED
             total_paid = 0.0
         
-        return ClaimSchema(
+        return ClaimRecord(
             claim_id=claim_id,
             patient_id=patient.patient_id,
             provider_id=provider.provider_id,
@@ -161,38 +241,226 @@ class ClaimGenerator:
             primary_procedure_code=procedure_code
         )
     
+    def _claim_amounts(
+        self,
+        type_idx: np.ndarray,
+        high_risk: np.ndarray,
+        u_charge: np.ndarray,
+        u_deny: np.ndarray,
+        u_status: np.ndarray,
+        u_paid: np.ndarray
+    ) -> tuple:
+        """
+        Numeric kernel: charges, denial, status and paid amounts from uniform draws
+        
+        Pure array arithmetic over integer claim type codes and [0, 1)
+        uniforms, with the same coherence rules as generate_claim.
+        
+        Returns:
+            (total_charge, should_deny, status_idx, total_paid)
+        """
+        # Charge amount based on claim type
+        charge_lo = self._charge_lo[type_idx]
+        total_charge = np.round(charge_lo + (self._charge_hi[type_idx] - charge_lo) * u_charge, 2)
+        
+        # Denial probability
+        deny_p = np.select(
+            [
+                (total_charge > 10000) & self._high_cost_type[type_idx],
+                high_risk,
+                type_idx == self._emergency_code,
+            ],
+            [0.25, 0.20, 0.05],
+            default=0.15
+        )
+        should_deny = u_deny < deny_p
+        
+        # Weighted status for claims that are not denied
+        status_idx = np.where(
+            should_deny,
+            self._denied_code,
+            self._non_denied_cdf.searchsorted(u_status, side='right')
+        )
+        
+        # Paid amount based on status
+        paid_lo = self._paid_lo[status_idx]
+        total_paid = np.round(total_charge * (paid_lo + (self._paid_hi[status_idx] - paid_lo) * u_paid), 2)
+        return total_charge, should_deny, status_idx, total_paid
+    
+    def _sample_claim_columns(
+        self,
+        patient_ids: Sequence[str],
+        provider_ids: Sequence[str],
+        diagnosis_codes: Sequence[str],
+        procedure_codes: Sequence[str],
+        claims_per_patient: int,
+        start_id: int,
+        diagnosis_tables: tuple
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sample claims for a batch of patients as columns (structure of arrays)
+        
+        All random draws are made once as NumPy arrays of length
+        len(patient_ids) * claims_per_patient; the only per-row Python work is
+        formatting the claim IDs.
+        
+        Args:
+            diagnosis_tables: Output of _diagnosis_tables(diagnosis_codes)
+            
+        Returns:
+            One array per ClaimRecord field, in field order (NaT/None for nulls)
+        """
+        reason_table, reason_counts, high_risk = diagnosis_tables
+        rng = self.rng
+        m = len(patient_ids) * claims_per_patient
+        
+        # Claim-level draws
+        patient_idx = np.repeat(np.arange(len(patient_ids)), claims_per_patient)
+        provider_idx = rng.integers(0, len(provider_ids), m)
+        diag_idx = rng.integers(0, len(diagnosis_codes), m)
+        type_idx = rng.choice(len(self._claim_types), size=m, p=self._claim_type_p)
+        has_procedure = rng.random(m) > 0.3
+        procedure_idx = rng.integers(0, max(len(procedure_codes), 1), m)
+        
+        # Claim dates (within last 2 years) and inpatient length of stay (1-14 days)
+        today = np.datetime64(self._today, 'D')
+        claim_dates = today - rng.integers(0, 731, m).astype('timedelta64[D]')
+        discharge_dates = claim_dates + rng.integers(1, 15, m).astype('timedelta64[D]')
+        is_inpatient = type_idx == self._inpatient_code
+        
+        # Uniform draws for the numeric kernel, in the kernel's draw order
+        u_charge = rng.random(m)
+        u_deny = rng.random(m)
+        u_reason = rng.random(m)
+        u_status = rng.random(m)
+        u_paid = rng.random(m)
+        total_charge, should_deny, status_idx, total_paid = self._claim_amounts(
+            type_idx, high_risk[diag_idx], u_charge, u_deny, u_status, u_paid
+        )
+        
+        # Coherent denial reason for denied claims
+        reason_pick = (u_reason * reason_counts[diag_idx, type_idx]).astype(np.int64)
+        denial_reasons = np.where(should_deny, reason_table[diag_idx, type_idx, reason_pick], None)
+        
+        no_date = np.datetime64('NaT', 'D')
+        claim_types = np.array(self._claim_types, dtype=object)
+        statuses = np.array(self._statuses, dtype=object)
+        procedures = np.array(list(procedure_codes) or [None], dtype=object)
+        
+        return {
+            'claim_id': np.array([f"CLM{i}" for i in range(start_id, start_id + m)], dtype=object),
+            'patient_id': np.asarray(patient_ids, dtype=object)[patient_idx],
+            'provider_id': np.asarray(provider_ids, dtype=object)[provider_idx],
+            'claim_date': claim_dates,
+            'admission_date': np.where(is_inpatient, claim_dates, no_date),
+            'discharge_date': np.where(is_inpatient, discharge_dates, no_date),
+            'claim_type': claim_types[type_idx],
+            'total_charge': total_charge,
+            'total_paid': total_paid,
+            'claim_status': statuses[status_idx],
+            'denial_reason': denial_reasons,
+            'primary_diagnosis_code': np.asarray(diagnosis_codes, dtype=object)[diag_idx],
+            'primary_procedure_code': np.where(has_procedure, procedures[procedure_idx], None),
+            'created_at': np.full(m, np.datetime64(datetime.now(), 'us')),
+        }
+    
+    @staticmethod
+    def claims_from_columns(columns: Dict[str, np.ndarray]) -> List[ClaimRecord]:
+        """Build ClaimRecord objects from a batch produced by iter_claim_columns"""
+        # Columns are in field order and ClaimRecord is array_like, so the
+        # whole batch of row tuples is converted in one call
+        rows = list(zip(*(values.tolist() for values in columns.values())))
+        return msgspec.convert(rows, List[ClaimRecord])
+    
+    def iter_claim_columns(
+        self,
+        patient_ids: Sequence[str],
+        provider_ids: Sequence[str],
+        diagnosis_codes: Sequence[str],
+        procedure_codes: Sequence[str],
+        claims_per_patient: int = 3,
+        start_id: int = 1000000,
+        batch_size: int = 10000
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Lazily generate claims for the given patients as columnar batches
+        
+        Args:
+            batch_size: Number of patients sampled per vectorized batch
+        """
+        if claims_per_patient <= 0:
+            return
+        diagnosis_tables = self._diagnosis_tables(diagnosis_codes)
+        for offset in range(0, len(patient_ids), batch_size):
+            batch = patient_ids[offset:offset + batch_size]
+            yield self._sample_claim_columns(
+                batch, provider_ids, diagnosis_codes, procedure_codes,
+                claims_per_patient, start_id + offset * claims_per_patient,
+                diagnosis_tables
+            )
+    
+    def iter_claims(
+        self,
+        patient_ids: Sequence[str],
+        provider_ids: Sequence[str],
+        diagnosis_codes: Sequence[str],
+        procedure_codes: Sequence[str],
+        claims_per_patient: int = 3,
+        start_id: int = 1000000,
+        batch_size: int = 10000
+    ) -> Iterator[ClaimRecord]:
+        """
+        Lazily generate claims for the given patients
+        
+        Args:
+            batch_size: Number of patients sampled per vectorized batch
+        """
+        for columns in self.iter_claim_columns(
+            patient_ids, provider_ids, diagnosis_codes, procedure_codes,
+            claims_per_patient, start_id, batch_size
+        ):
+            yield from self.claims_from_columns(columns)
+    
+    def generate_claims_arrow(
+        self,
+        patient_ids: Sequence[str],
+        provider_ids: Sequence[str],
+        diagnosis_codes: Sequence[str],
+        procedure_codes: Sequence[str],
+        claims_per_patient: int = 3,
+        start_id: int = 1000000
+    ) -> pa.Table:
+        """Generate claims for the given patients as an Arrow table, without building records"""
+        schema = arrow_schema(ClaimRecord, self.CATEGORICAL_FIELDS)
+        return pa.Table.from_batches(
+            [
+                pa.RecordBatch.from_pydict(columns, schema=schema)
+                for columns in self.iter_claim_columns(
+                    patient_ids, provider_ids, diagnosis_codes, procedure_codes,
+                    claims_per_patient, start_id
+                )
+            ],
+            schema=schema
+        )
+    
     def generate_claims(
         self,
-        patients: List[PatientSchema],
+        patients: List[PatientRecord],
         providers: List[ProviderSchema],
         diagnosis_codes: List[str],
         procedure_codes: List[str],
         claims_per_patient: int = 3,
         start_id: int = 1000000
-    ) -> List[ClaimSchema]:
+    ) -> List[ClaimRecord]:
         """Generate multiple claim records"""
-        claims = []
-        claim_counter = start_id
-        
-        for patient in patients:
-            # Generate exactly claims_per_patient claims for each patient
-            for _ in range(claims_per_patient):
-                provider = random.choice(providers)
-                diagnosis = random.choice(diagnosis_codes)
-                procedure = random.choice(procedure_codes) if random.random() > 0.3 else None
-                
-                claim_id = f"CLM{claim_counter}"
-                claim = self.generate_claim(
-                    claim_id=claim_id,
-                    patient=patient,
-                    provider=provider,
-                    diagnosis_code=diagnosis,
-                    procedure_code=procedure
-                )
-                claims.append(claim)
-                claim_counter += 1
-        
-        return claims
+        return list(self.iter_claims(
+            [p.patient_id for p in patients],
+            [p.provider_id for p in providers],
+            diagnosis_codes,
+            procedure_codes,
+            claims_per_patient,
+            start_id
+        ))
 
 
 if __name__ == "__main__":
@@ -4,245 +4,428 @@ Generates realistic clinical notes with medical terminology
 """
 
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 import random
-from faker import Faker
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from ingestion.schemas import NoteSchema, ClaimSchema
+from ingestion.schemas import NoteRecord, ClaimRecord, arrow_schema
 
 
-class NoteGenerator:
-    """Generate synthetic clinical notes with coherent context"""
-    
-    def __init__(self, seed: int = None):
-        self.fake = Faker()
-        if seed:
-            Faker.seed(seed)
-            random.seed(seed)
-        
-        # Coherence mappings for context-aware notes
-        self.diagnosis_symptoms = {
-            'E11.9': ['elevated blood glucose', 'increased thirst', 'frequent urination', 'fatigue'],
-            'E10.9': ['elevated blood glucose', 'weight loss', 'increased thirst'],
-            'I10': ['elevated blood pressure', 'headache', 'dizziness'],
-            'M54.5': ['lower back pain', 'radiating pain', 'stiffness'],
-            'M25.561': ['right knee pain', 'swelling', 'limited range of motion'],
-            'J44.1': ['shortness of breath', 'chronic cough', 'wheezing', 'chest tightness'],
-            'J18.9': ['fever', 'cough', 'shortness of breath', 'chest pain'],
-            'F41.9': ['anxiety', 'restlessness', 'difficulty concentrating', 'sleep disturbances'],
-            'F32.9': ['depressed mood', 'loss of interest', 'fatigue', 'sleep disturbances'],
-        }
-        
-        self.diagnosis_treatments = {
-            'E11.9': ['blood glucose monitoring', 'diabetes medication', 'dietary counseling'],
-            'E10.9': ['insulin therapy', 'blood glucose monitoring', 'diabetes education'],
-            'I10': ['antihypertensive medication', 'blood pressure monitoring', 'lifestyle counseling'],
-            'M54.5': ['pain management', 'physical therapy', 'imaging studies'],
-            'M25.561': ['pain medication', 'knee imaging', 'orthopedic consultation'],
-            'J44.1': ['bronchodilator therapy', 'oxygen therapy', 'pulmonary function tests'],
-            'J18.9': ['antibiotic therapy', 'chest imaging', 'supportive care'],
-            'F41.9': ['anxiety medication', 'counseling', 'psychiatric evaluation'],
-            'F32.9': ['antidepressant medication', 'psychotherapy', 'psychiatric evaluation'],
-        }
-        
-        self.denial_explanations = {
-            'INSUFFICIENT_INFO': 'Claim denied due to missing or incomplete documentation required for processing.',
-            'NOT_MEDICALLY_NECESSARY': 'Services were determined not to be medically necessary based on clinical guidelines.',
-            'DUPLICATE_CLAIM': 'Claim denied as duplicate of previously submitted claim.',
-            'AUTHORIZATION_REQUIRED': 'Prior authorization was required but not obtained before service delivery.',
-            'PRE_AUTH_REQUIRED': 'Pre-authorization was required but not obtained.',
-            'TIMELY_FILING': 'Claim submitted outside of timely filing window.',
-        }
-        
-        self.assessments = [
-            "stable condition", "improving", "deteriorating", "critical", "guarded",
-            "fair", "good", "poor", "acute", "chronic", "subacute"
-        ]
-        
-        self.vital_signs_templates = [
-            "BP {systolic}/{diastolic}, HR {hr}, RR {rr}, Temp {temp}F, O2 Sat {o2}%",
-            "Vitals: {systolic}/{diastolic} mmHg, {hr} bpm, {temp}F",
-            "Blood pressure {systolic}/{diastolic}, heart rate {hr}, temperature {temp}F"
-        ]
-    
-    def generate_vital_signs(self) -> dict:
-        """Generate realistic vital signs"""
-        return {
-            'systolic': random.randint(90, 160),
-            'diastolic': random.randint(60, 100),
-            'hr': random.randint(60, 100),
-            'rr': random.randint(12, 20),
-            'temp': round(random.uniform(97.0, 99.5), 1),
-            'o2': random.randint(95, 100)
-        }
-    
-    def generate_admission_note(self, claim: ClaimSchema) -> str:
-        """Generate admission note with coherent context"""
-        vitals = self.generate_vital_signs()
-        symptoms_list = self.diagnosis_symptoms.get(claim.primary_diagnosis_code, ['generalized symptoms'])
-        treatments_list = self.diagnosis_treatments.get(claim.primary_diagnosis_code, ['symptomatic treatment'])
-        symptom = random.choice(symptoms_list)
-        treatment = random.choice(treatments_list)
-        assessment = random.choice(self.assessments)
-        
-        denial_context = ""
-        if claim.claim_status == 'DENIED' and claim.denial_reason:
-            denial_explanation = self.denial_explanations.get(claim.denial_reason, "Claim was denied.")
-            denial_context = f"\n\nCLAIM STATUS:\nThis claim was denied. Reason: {denial_explanation}"
-        
-        note = f"""ADMISSION NOTE
+# Coherence mappings for context-aware notes
+_DIAGNOSIS_SYMPTOMS: Mapping[str, Tuple[str, ...]] = {
+    'E11.9': ('elevated blood glucose', 'increased thirst', 'frequent urination', 'fatigue'),
+    'E10.9': ('elevated blood glucose', 'weight loss', 'increased thirst'),
+    'I10': ('elevated blood pressure', 'headache', 'dizziness'),
+    'M54.5': ('lower back pain', 'radiating pain', 'stiffness'),
+    'M25.561': ('right knee pain', 'swelling', 'limited range of motion'),
+    'J44.1': ('shortness of breath', 'chronic cough', 'wheezing', 'chest tightness'),
+    'J18.9': ('fever', 'cough', 'shortness of breath', 'chest pain'),
+    'F41.9': ('anxiety', 'restlessness', 'difficulty concentrating', 'sleep disturbances'),
+    'F32.9': ('depressed mood', 'loss of interest', 'fatigue', 'sleep disturbances'),
+}
+
+_DIAGNOSIS_TREATMENTS: Mapping[str, Tuple[str, ...]] = {
+    'E11.9': ('blood glucose monitoring', 'diabetes medication', 'dietary counseling'),
+    'E10.9': ('insulin therapy', 'blood glucose monitoring', 'diabetes education'),
+    'I10': ('antihypertensive medication', 'blood pressure monitoring', 'lifestyle counseling'),
+    'M54.5': ('pain management', 'physical therapy', 'imaging studies'),
+    'M25.561': ('pain medication', 'knee imaging', 'orthopedic consultation'),
+    'J44.1': ('bronchodilator therapy', 'oxygen therapy', 'pulmonary function tests'),
+    'J18.9': ('antibiotic therapy', 'chest imaging', 'supportive care'),
+    'F41.9': ('anxiety medication', 'counseling', 'psychiatric evaluation'),
+    'F32.9': ('antidepressant medication', 'psychotherapy', 'psychiatric evaluation'),
+}
+
+_DENIAL_EXPLANATIONS: Mapping[str, str] = {
+    'INSUFFICIENT_INFO': 'Claim denied due to missing or incomplete documentation required for processing.',
+    'NOT_MEDICALLY_NECESSARY': 'Services were determined not to be medically necessary based on clinical guidelines.',
+    'DUPLICATE_CLAIM': 'Claim denied as duplicate of previously submitted claim.',
+    'AUTHORIZATION_REQUIRED': 'Prior authorization was required but not obtained before service delivery.',
+    'PRE_AUTH_REQUIRED': 'Pre-authorization was required but not obtained.',
+    'TIMELY_FILING': 'Claim submitted outside of timely filing window.',
+}
+
+# Fallbacks for diagnoses without a symptom/treatment mapping
+_DEFAULT_SYMPTOMS = ('generalized symptoms',)
+_DEFAULT_TREATMENTS = ('symptomatic treatment',)
+
+_SYMPTOMS_GET = _DIAGNOSIS_SYMPTOMS.get
+_TREATMENTS_GET = _DIAGNOSIS_TREATMENTS.get
+_DENIAL_EXPLANATIONS_GET = _DENIAL_EXPLANATIONS.get
+
 
-Patient admitted on {claim.admission_date.strftime('%Y-%m-%d') if claim.admission_date else claim.claim_date.strftime('%Y-%m-%d')}.
+# Note bodies by template key: %-format strings filled from NoteGenerator._context
+NOTE_TEMPLATES = {
+    'ADMISSION': """ADMISSION NOTE
+
+Patient admitted on %(admission_date)s.
 
 CHIEF COMPLAINT:
-Patient presents with {symptom}.
+Patient presents with %(symptom)s.
 
 VITAL SIGNS:
-{self.vital_signs_templates[0].format(**vitals)}
+%(vitals)s
 
 ASSESSMENT:
-Patient is in {assessment} condition. Primary diagnosis: {claim.primary_diagnosis_code}.
-{denial_context}
+Patient is in %(assessment)s condition. Primary diagnosis: %(diagnosis)s.
+%(denial_context)s
 
 PLAN:
-{treatment}. Continue monitoring and reassess as needed."""
-        
-        return note
-    
-    def generate_discharge_note(self, claim: ClaimSchema) -> str:
-        """Generate discharge note with coherent context"""
-        assessment = random.choice(self.assessments)
-        treatments_list = self.diagnosis_treatments.get(claim.primary_diagnosis_code, ['symptomatic treatment'])
-        treatment_provided = random.choice(treatments_list)
-        procedure_info = f" Procedure performed: CPT {claim.primary_procedure_code}." if claim.primary_procedure_code else ""
-        
-        denial_context = ""
-        if claim.claim_status == 'DENIED' and claim.denial_reason:
-            denial_explanation = self.denial_explanations.get(claim.denial_reason, "Claim was denied.")
-            denial_context = f"\n\nCLAIM STATUS:\nThis claim was denied. Reason: {denial_explanation}"
-        
-        note = f"""DISCHARGE SUMMARY
+%(treatment)s. Continue monitoring and reassess as needed.""",
+    'DISCHARGE': """DISCHARGE SUMMARY
 
-Patient discharged on {claim.discharge_date.strftime('%Y-%m-%d') if claim.discharge_date else claim.claim_date.strftime('%Y-%m-%d')}.
+Patient discharged on %(discharge_date)s.
 
 HOSPITAL COURSE:
-Patient was admitted for treatment of {claim.primary_diagnosis_code}.{procedure_info}
-During hospitalization, patient received {treatment_provided} and showed improvement.
+Patient was admitted for treatment of %(diagnosis)s.%(procedure_info)s
+During hospitalization, patient received %(treatment)s and showed improvement.
 
 DISCHARGE CONDITION:
-Patient is in {assessment} condition at time of discharge.{denial_context}
+Patient is in %(assessment)s condition at time of discharge.%(denial_context)s
 
 DISCHARGE INSTRUCTIONS:
 Follow-up with primary care provider within 7-10 days. Continue medications as prescribed.
-Return to emergency department if symptoms worsen."""
-        
-        return note
-    
-    def generate_progress_note(self, claim: ClaimSchema) -> str:
-        """Generate progress note with coherent context"""
-        vitals = self.generate_vital_signs()
-        assessment = random.choice(self.assessments)
-        symptoms_list = self.diagnosis_symptoms.get(claim.primary_diagnosis_code, ['generalized symptoms'])
-        treatments_list = self.diagnosis_treatments.get(claim.primary_diagnosis_code, ['symptomatic treatment'])
-        symptom_status = "improvement" if random.random() > 0.3 else "persistent " + random.choice(symptoms_list)
-        treatment = random.choice(treatments_list)
-        
-        denial_context = ""
-        if claim.claim_status == 'DENIED' and claim.denial_reason:
-            denial_explanation = self.denial_explanations.get(claim.denial_reason, "Claim was denied.")
-            denial_context = f"\n\nCLAIM STATUS:\nThis claim was denied. Reason: {denial_explanation}"
-        
-        note = f"""PROGRESS NOTE - {claim.claim_date.strftime('%Y-%m-%d')}
+Return to emergency department if symptoms worsen.""",
+    'PROGRESS': """PROGRESS NOTE - %(claim_date)s
 
 SUBJECTIVE:
-Patient reports {symptom_status} in symptoms related to {claim.primary_diagnosis_code}.
+Patient reports %(symptom_status)s in symptoms related to %(diagnosis)s.
 
 OBJECTIVE:
-Vital signs: {self.vital_signs_templates[1].format(**vitals)}
+Vital signs: %(vitals)s
 
 ASSESSMENT:
-Patient condition is {assessment}. Diagnosis: {claim.primary_diagnosis_code}.{denial_context}
+Patient condition is %(assessment)s. Diagnosis: %(diagnosis)s.%(denial_context)s
 
 PLAN:
-Continue {treatment}. Monitor response and reassess as needed."""
-        
-        return note
-    
-    def generate_procedure_note(self, claim: ClaimSchema) -> str:
-        """Generate procedure note with coherent context"""
-        procedure_code = claim.primary_procedure_code or "N/A"
-        symptoms_list = self.diagnosis_symptoms.get(claim.primary_diagnosis_code, ['generalized symptoms'])
-        indication_symptom = random.choice(symptoms_list)
-        
-        denial_context = ""
-        if claim.claim_status == 'DENIED' and claim.denial_reason:
-            denial_explanation = self.denial_explanations.get(claim.denial_reason, "Claim was denied.")
-            denial_context = f"\n\nCLAIM STATUS:\nThis claim was denied. Reason: {denial_explanation}"
-        
-        note = f"""PROCEDURE NOTE - {claim.claim_date.strftime('%Y-%m-%d')}
+Continue %(treatment)s. Monitor response and reassess as needed.""",
+    'PROCEDURE': """PROCEDURE NOTE - %(claim_date)s
 
 PROCEDURE:
-CPT Code: {procedure_code}
+CPT Code: %(procedure_code)s
 
 INDICATION:
-Procedure performed for diagnosis and treatment of {claim.primary_diagnosis_code}. 
-Patient presented with {indication_symptom}.
+Procedure performed for diagnosis and treatment of %(diagnosis)s. 
+Patient presented with %(symptom)s.
 
 PROCEDURE DESCRIPTION:
-Procedure was performed successfully without complications. Patient tolerated procedure well.{denial_context}
+Procedure was performed successfully without complications. Patient tolerated procedure well.%(denial_context)s
 
 POST-PROCEDURE:
-Patient is stable. Monitor for any complications. Follow-up as indicated for {claim.primary_diagnosis_code}."""
-        
-        return note
-    
-    def generate_denial_note(self, claim: ClaimSchema) -> str:
-        """Generate a denial explanation note"""
-        if not claim.denial_reason:
-            return self.generate_progress_note(claim)
-        
-        denial_explanation = self.denial_explanations.get(claim.denial_reason, "Claim was denied.")
-        
-        # Get diagnosis context
-        diagnosis_info = f"Diagnosis: {claim.primary_diagnosis_code}"
-        if claim.primary_procedure_code:
-            diagnosis_info += f", Procedure: CPT {claim.primary_procedure_code}"
-        
-        note = f"""CLAIM DENIAL NOTICE - {claim.claim_date.strftime('%Y-%m-%d')}
+Patient is stable. Monitor for any complications. Follow-up as indicated for %(diagnosis)s.""",
+    'DENIAL': """CLAIM DENIAL NOTICE - %(claim_date)s
 
 CLAIM INFORMATION:
-Claim ID: {claim.claim_id}
-{diagnosis_info}
-Claim Type: {claim.claim_type}
-Total Charge: ${claim.total_charge:,.2f}
+Claim ID: %(claim_id)s
+%(diagnosis_info)s
+Claim Type: %(claim_type)s
+Total Charge: $%(total_charge)s
 
 DENIAL REASON:
-{denial_explanation}
+%(denial_explanation)s
 
 DETAILS:
 This claim was reviewed and denied based on the above reason. 
-{diagnosis_info} was submitted for this claim.
+%(diagnosis_info)s was submitted for this claim.
 
 NEXT STEPS:
 Provider may submit additional documentation or appeal this denial if additional 
-information is available that supports medical necessity or addresses the denial reason."""
+information is available that supports medical necessity or addresses the denial reason.""",
+}
+
+# Optional sections spliced into the templates by _get_formatter
+_DENIAL_CONTEXT = "\n\nCLAIM STATUS:\nThis claim was denied. Reason: %(denial_explanation)s"
+_PROCEDURE_INFO = " Procedure performed: CPT %(procedure_code)s."
+_DIAGNOSIS_INFO = "Diagnosis: %(diagnosis)s"
+_PROCEDURE_DETAIL = ", Procedure: CPT %(procedure_code)s"
+
+# Index into vital_signs_templates for the templates that include vitals
+NOTE_VITALS = {'ADMISSION': 0, 'PROGRESS': 1}
+
+# Note types picked for inpatient claims
+INPATIENT_NOTE_TYPES = ('ADMISSION', 'DISCHARGE', 'PROGRESS')
+
+
+class NoteDraws(NamedTuple):
+    """Random values consumed by one note (rolls are uniform in [0, 1))"""
+    type_roll: float
+    visit_pick: int
+    symptom_roll: float
+    status_roll: float
+    treatment_roll: float
+    assessment_pick: int
+    systolic: int
+    diastolic: int
+    hr: int
+    rr: int
+    temp: float
+    o2: int
+
+
+# Inclusive ranges of the integer vital signs: systolic, diastolic, hr, rr, o2
+_VITAL_LOW = np.array([90, 60, 60, 12, 95])
+_VITAL_HIGH = np.array([160, 100, 100, 20, 100])
+
+
+def _vitals_batch(rng: np.random.Generator, n: int) -> Tuple[np.ndarray, ...]:
+    """
+    Draw n sets of vital signs (same ranges as NoteGenerator.generate_vital_signs)
+    
+    The integer vitals come from a single (n, 5) draw.
+    
+    Returns:
+        (systolic, diastolic, hr, rr, temp, o2) columns
+    """
+    vitals = rng.integers(_VITAL_LOW, _VITAL_HIGH, size=(n, 5), endpoint=True)
+    temp = np.round(rng.uniform(97.0, 99.5, n), 1)
+    systolic, diastolic, hr, rr, o2 = vitals.T
+    return systolic, diastolic, hr, rr, temp, o2
+
+
+def _claim_context(claim: ClaimRecord) -> dict:
+    """
+    Substitution values that depend only on the claim
+    
+    Built once per claim and shared by all of its notes. 'flags' holds the
+    (has_denial, has_procedure, has_admission) key of the claim's
+    specialized formatters.
+    """
+    claim_date = claim.claim_date.strftime('%Y-%m-%d')
+    has_admission = claim.admission_date is not None
+    
+    context = {
+        'flags': (
+            claim.claim_status == 'DENIED' and bool(claim.denial_reason),
+            bool(claim.primary_procedure_code),
+            has_admission,
+        ),
+        'claim_id': claim.claim_id,
+        'claim_type': claim.claim_type,
+        'claim_date': claim_date,
+        'diagnosis': claim.primary_diagnosis_code,
+        'procedure_code': claim.primary_procedure_code,
+        'total_charge': f"{claim.total_charge:,.2f}",
+        'denial_explanation': _DENIAL_EXPLANATIONS_GET(claim.denial_reason, "Claim was denied."),
+    }
+    if has_admission:
+        context['admission_date'] = claim.admission_date.strftime('%Y-%m-%d')
+        context['discharge_date'] = claim.discharge_date.strftime('%Y-%m-%d') if claim.discharge_date else claim_date
+    return context
+
+
+@lru_cache(maxsize=None)
+def _get_formatter(
+    note_type: str,
+    has_denial: bool,
+    has_procedure: bool,
+    has_admission: bool
+) -> Callable[[dict], str]:
+    """
+    Formatter for one note type, specialized to a claim's features
+    
+    The optional denial/procedure sections and the admission/discharge date
+    fallbacks are resolved into the format string once per combination,
+    so rendering a note is a single %-format with no branches.
+    """
+    template = NOTE_TEMPLATES[note_type]
+    diagnosis_info = _DIAGNOSIS_INFO + (_PROCEDURE_DETAIL if has_procedure else "")
+    replacements = {
+        '%(denial_context)s': _DENIAL_CONTEXT if has_denial else "",
+        '%(procedure_info)s': _PROCEDURE_INFO if has_procedure else "",
+        '%(procedure_code)s': '%(procedure_code)s' if has_procedure else "N/A",
+        '%(diagnosis_info)s': diagnosis_info,
+    }
+    if not has_admission:
+        replacements['%(admission_date)s'] = '%(claim_date)s'
+        replacements['%(discharge_date)s'] = '%(claim_date)s'
+    for placeholder, value in replacements.items():
+        template = template.replace(placeholder, value)
+    return template.__mod__
+
+
+def _pick(options: Sequence[str], roll: float) -> str:
+    """Option selected by a uniform roll"""
+    return options[int(roll * len(options))]
+
+
+class NoteGenerator:
+    """Generate synthetic clinical notes with coherent context"""
+    
+    def __init__(self, seed: int = None):
+        if seed:
+            random.seed(seed)
+        self.rng = np.random.default_rng(seed)
+        
+        self.assessments = [
+            "stable condition", "improving", "deteriorating", "critical", "guarded",
+            "fair", "good", "poor", "acute", "chronic", "subacute"
+        ]
+        
+        self.vital_signs_templates = (
+            "BP {systolic}/{diastolic}, HR {hr}, RR {rr}, Temp {temp}F, O2 Sat {o2}%",
+            "Vitals: {systolic}/{diastolic} mmHg, {hr} bpm, {temp}F",
+        )
+    
+    def generate_vital_signs(self) -> dict:
+        """Generate realistic vital signs"""
+        return {
+            'systolic': random.randint(90, 160),
+            'diastolic': random.randint(60, 100),
+            'hr': random.randint(60, 100),
+            'rr': random.randint(12, 20),
+            'temp': round(random.uniform(97.0, 99.5), 1),
+            'o2': random.randint(95, 100)
+        }
+    
+    def _draw(self) -> NoteDraws:
+        """Random values for a single note"""
+        vitals = self.generate_vital_signs()
+        return NoteDraws(
+            type_roll=random.random(),
+            visit_pick=random.randrange(len(INPATIENT_NOTE_TYPES)),
+            symptom_roll=random.random(),
+            status_roll=random.random(),
+            treatment_roll=random.random(),
+            assessment_pick=random.randrange(len(self.assessments)),
+            **vitals
+        )
+    
+    def _draw_batch(self, n: int) -> List[NoteDraws]:
+        """Random values for n notes, each drawn once as a NumPy array"""
+        rng = self.rng
+        columns = (
+            rng.random(n),
+            rng.integers(0, len(INPATIENT_NOTE_TYPES), n),
+            rng.random(n),
+            rng.random(n),
+            rng.random(n),
+            rng.integers(0, len(self.assessments), n),
+            *_vitals_batch(rng, n),
+        )
+        return list(map(NoteDraws._make, zip(*(column.tolist() for column in columns))))
+    
+    def _context(self, claim_context: dict, draws: NoteDraws) -> dict:
+        """Substitution values for one note: the claim's context plus this note's picks"""
+        diagnosis = claim_context['diagnosis']
+        symptom = _pick(_SYMPTOMS_GET(diagnosis, _DEFAULT_SYMPTOMS), draws.symptom_roll)
         
-        return note
+        context = dict(claim_context)
+        context['symptom'] = symptom
+        context['symptom_status'] = "improvement" if draws.status_roll > 0.3 else "persistent " + symptom
+        context['treatment'] = _pick(_TREATMENTS_GET(diagnosis, _DEFAULT_TREATMENTS), draws.treatment_roll)
+        context['assessment'] = self.assessments[draws.assessment_pick]
+        return context
+    
+    def _render(
+        self,
+        note_type: str,
+        claim: ClaimRecord,
+        draws: Optional[NoteDraws],
+        claim_context: Optional[dict]
+    ) -> str:
+        """Fill the note_type template from the claim's context"""
+        if draws is None:
+            draws = self._draw()
+        if claim_context is None:
+            claim_context = _claim_context(claim)
+        context = self._context(claim_context, draws)
+        vitals_template = NOTE_VITALS.get(note_type)
+        if vitals_template is not None:
+            context['vitals'] = self.vital_signs_templates[vitals_template].format_map(draws._asdict())
+        return _get_formatter(note_type, *claim_context['flags'])(context)
+    
+    def generate_admission_note(
+        self,
+        claim: ClaimRecord,
+        draws: Optional[NoteDraws] = None,
+        claim_context: Optional[dict] = None
+    ) -> str:
+        """Generate admission note with coherent context"""
+        return self._render('ADMISSION', claim, draws, claim_context)
+    
+    def generate_discharge_note(
+        self,
+        claim: ClaimRecord,
+        draws: Optional[NoteDraws] = None,
+        claim_context: Optional[dict] = None
+    ) -> str:
+        """Generate discharge note with coherent context"""
+        return self._render('DISCHARGE', claim, draws, claim_context)
+    
+    def generate_progress_note(
+        self,
+        claim: ClaimRecord,
+        draws: Optional[NoteDraws] = None,
+        claim_context: Optional[dict] = None
+    ) -> str:
+        """Generate progress note with coherent context"""
+        return self._render('PROGRESS', claim, draws, claim_context)
+    
+    def generate_procedure_note(
+        self,
+        claim: ClaimRecord,
+        draws: Optional[NoteDraws] = None,
+        claim_context: Optional[dict] = None
+    ) -> str:
+        """Generate procedure note with coherent context"""
+        return self._render('PROCEDURE', claim, draws, claim_context)
+    
+    def generate_denial_note(
+        self,
+        claim: ClaimRecord,
+        draws: Optional[NoteDraws] = None,
+        claim_context: Optional[dict] = None
+    ) -> str:
+        """Generate a denial explanation note"""
+        if not claim.denial_reason:
+            return self.generate_progress_note(claim, draws, claim_context)
+        return self._render('DENIAL', claim, draws, claim_context)
     
     def generate_note(
         self,
         note_id: str,
-        claim: ClaimSchema,
-        note_type: Optional[str] = None
-    ) -> NoteSchema:
-        """Generate a clinical note"""
+        claim: ClaimRecord,
+        note_type: Optional[str] = None,
+        draws: Optional[NoteDraws] = None,
+        claim_context: Optional[dict] = None
+    ) -> NoteRecord:
+        """
+        Generate a clinical note
+        
+        Args:
+            draws: Pre-drawn random values (drawn from `random` when omitted)
+            claim_context: Precomputed _claim_context(claim), shared by the claim's notes
+        """
+        note_type, note_text = self._note_content(claim, note_type, draws, claim_context)
+        return NoteRecord(
+            note_id=note_id,
+            claim_id=claim.claim_id,
+            note_type=note_type,
+            note_text=note_text
+        )
+    
+    def _note_content(
+        self,
+        claim: ClaimRecord,
+        note_type: Optional[str],
+        draws: Optional[NoteDraws],
+        claim_context: Optional[dict]
+    ) -> Tuple[str, str]:
+        """Pick the note type (unless given) and render its text"""
+        if draws is None:
+            draws = self._draw()
         if note_type is None:
             # If claim is denied, sometimes generate a denial note
-            if claim.claim_status == 'DENIED' and random.random() < 0.3:
+            if claim.claim_status == 'DENIED' and draws.type_roll < 0.3:
                 note_type = 'DIAGNOSIS'  # Use DIAGNOSIS type for denial notes
             # Determine note type based on claim type
             elif claim.claim_type == 'INPATIENT':
-                note_type = random.choice(['ADMISSION', 'DISCHARGE', 'PROGRESS'])
+                note_type = INPATIENT_NOTE_TYPES[draws.visit_pick]
             elif claim.primary_procedure_code:
                 note_type = 'PROCEDURE'
             else:
@@ -250,43 +433,113 @@ information is available that supports medical necessity or addresses the denial
         
         # Generate note text based on type
         if note_type == 'ADMISSION':
-            note_text = self.generate_admission_note(claim)
+            note_text = self.generate_admission_note(claim, draws, claim_context)
         elif note_type == 'DISCHARGE':
-            note_text = self.generate_discharge_note(claim)
+            note_text = self.generate_discharge_note(claim, draws, claim_context)
         elif note_type == 'PROCEDURE':
-            note_text = self.generate_procedure_note(claim)
+            note_text = self.generate_procedure_note(claim, draws, claim_context)
         elif note_type == 'DIAGNOSIS' and claim.claim_status == 'DENIED':
             # Use DIAGNOSIS type for denial explanation notes
-            note_text = self.generate_denial_note(claim)
+            note_text = self.generate_denial_note(claim, draws, claim_context)
         else:  # PROGRESS
-            note_text = self.generate_progress_note(claim)
+            note_text = self.generate_progress_note(claim, draws, claim_context)
         
-        return NoteSchema(
-            note_id=note_id,
-            claim_id=claim.claim_id,
-            note_type=note_type,
-            note_text=note_text
-        )
+        return note_type, note_text
+    
+    def _iter_note_rows(
+        self,
+        claims: Iterable[ClaimRecord],
+        notes_per_claim: int,
+        start_id: int,
+        batch_size: int
+    ) -> Iterator[Tuple[str, str, str, str]]:
+        """Lazily generate (note_id, claim_id, note_type, note_text) rows"""
+        note_counter = start_id
+        note_content = self._note_content
+        per_claim = range(notes_per_claim)
+        claims = iter(claims)
+        
+        while True:
+            batch = list(islice(claims, batch_size))
+            if not batch:
+                return
+            draws = iter(self._draw_batch(len(batch) * notes_per_claim))
+            for claim in batch:
+                # Dates and denial context are built once for all of the claim's notes
+                claim_context = _claim_context(claim)
+                # Generate exactly notes_per_claim notes for each claim
+                for _ in per_claim:
+                    note_type, note_text = note_content(claim, None, next(draws), claim_context)
+                    yield f"NOTE{note_counter}", claim.claim_id, note_type, note_text
+                    note_counter += 1
+    
+    def iter_notes(
+        self,
+        claims: Iterable[ClaimRecord],
+        notes_per_claim: int = 1,
+        start_id: int = 100000,
+        batch_size: int = 1000
+    ) -> Iterator[NoteRecord]:
+        """
+        Lazily generate notes for a (possibly streamed) sequence of claims
+        
+        Args:
+            batch_size: Number of claims whose random values are drawn together
+        """
+        for note_id, claim_id, note_type, note_text in self._iter_note_rows(
+            claims, notes_per_claim, start_id, batch_size
+        ):
+            yield NoteRecord(note_id=note_id, claim_id=claim_id, note_type=note_type, note_text=note_text)
+    
+    def write_notes(
+        self,
+        claims: Iterable[ClaimRecord],
+        path: Union[str, Path],
+        notes_per_claim: int = 1,
+        start_id: int = 100000,
+        batch_size: int = 8192
+    ) -> int:
+        """
+        Stream notes for the given claims to a Parquet file
+        
+        Notes are accumulated into column lists and flushed as one row group
+        per batch_size notes, without building NoteRecord objects. Random
+        values are drawn per batch_size claims, as in iter_notes, so both
+        produce the same notes for the same seed and batch_size.
+        
+        Returns:
+            Number of notes written
+        """
+        schema = arrow_schema(NoteRecord)
+        rows = self._iter_note_rows(claims, notes_per_claim, start_id, batch_size)
+        count = 0
+        with pq.ParquetWriter(path, schema) as writer:
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                note_ids, claim_ids, note_types, note_texts = zip(*batch)
+                writer.write_table(pa.Table.from_pydict(
+                    {
+                        'note_id': note_ids,
+                        'claim_id': claim_ids,
+                        'note_type': note_types,
+                        'note_text': note_texts,
+                        'created_at': [datetime.now()] * len(batch),
+                    },
+                    schema=schema
+                ))
+                count += len(batch)
+        return count
     
     def generate_notes(
         self,
-        claims: List[ClaimSchema],
+        claims: List[ClaimRecord],
         notes_per_claim: int = 1,
         start_id: int = 100000
-    ) -> List[NoteSchema]:
+    ) -> List[NoteRecord]:
         """Generate notes for multiple claims"""
-        notes = []
-        note_counter = start_id
-        
-        for claim in claims:
-            # Generate exactly notes_per_claim notes for each claim
-            for _ in range(notes_per_claim):
-                note_id = f"NOTE{note_counter}"
-                note = self.generate_note(note_id, claim)
-                notes.append(note)
-                note_counter += 1
-        
-        return notes
+        return list(self.iter_notes(claims, notes_per_claim, start_id))
 
 
 if __name__ == "__main__":
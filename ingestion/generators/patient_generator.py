@@ -3,25 +3,57 @@ Patient data generator
 Generates HIPAA-compliant, de-identified patient demographics
 """
 
-from datetime import date, timedelta
-from typing import List
+from bisect import bisect
+from datetime import date, datetime, timedelta
+import itertools
+from typing import Dict, Iterator, List, Tuple
 import random
-from faker import Faker
-from faker.providers import date_time, person
+import sys
+import msgspec
+import numpy as np
+import pyarrow as pa
 
-from ingestion.schemas import PatientSchema
+from ingestion.schemas import PatientRecord, arrow_schema
+
+
+def _build_patient_arrays(
+    rng: np.random.Generator,
+    count: int,
+    max_age_days: int,
+    gender_p: np.ndarray,
+    n_zip3: int,
+    n_states: int
+) -> Tuple[np.ndarray, ...]:
+    """
+    Numeric kernel for batch patient sampling
+    
+    Returns integer arrays only (age in days and indices into the gender,
+    ZIP3 and state tables), so the caller maps codes to strings with a
+    single fancy-index per column.
+    
+    Returns:
+        (age_days, gender_idx, zip_idx, state_idx)
+    """
+    age_days = rng.integers(0, max_age_days + 1, count)
+    gender_idx = rng.choice(len(gender_p), size=count, p=gender_p)
+    zip_idx = rng.integers(0, n_zip3, count)
+    state_idx = rng.integers(0, n_states, count)
+    return age_days, gender_idx, zip_idx, state_idx
 
 
 class PatientGenerator:
     """Generate synthetic patient data"""
     
+    # Low-cardinality columns, dictionary-encoded on the Arrow path
+    CATEGORICAL_FIELDS = ('gender', 'state')
+    
     def __init__(self, seed: int = None):
-        self.fake = Faker()
         if seed:
-            Faker.seed(seed)
             random.seed(seed)
-        self.fake.add_provider(date_time)
-        self.fake.add_provider(person)
+        self.rng = np.random.default_rng(seed)
+        self._today = date.today()
+        # Default IDs for generate_patient calls without one
+        self._pat_counter = itertools.count(100000)
         
         # US states for realistic distribution
         self.states = [
@@ -29,32 +61,45 @@ class PatientGenerator:
             'NJ', 'VA', 'WA', 'AZ', 'MA', 'TN', 'IN', 'MO', 'MD', 'WI',
             'CO', 'MN', 'SC', 'AL', 'LA', 'KY', 'OR', 'OK', 'CT', 'IA'
         ]
+        # Interned so every generated record shares one object per value
+        self.states = [sys.intern(state) for state in self.states]
         
         # Gender distribution (realistic healthcare distribution)
-        self.gender_weights = {'M': 0.48, 'F': 0.50, 'O': 0.01, 'U': 0.01}
+        self.gender_weights = {
+            sys.intern(gender): weight
+            for gender, weight in {'M': 0.48, 'F': 0.50, 'O': 0.01, 'U': 0.01}.items()
+        }
+        self._gender_keys = list(self.gender_weights)
+        self._gender_cum = list(itertools.accumulate(self.gender_weights.values()))
+        
+        # 3-digit ZIP prefixes (first 3 digits only for privacy - HIPAA compliant)
+        self._zip3_pool = tuple(f"{i:03d}" for i in range(1000))
+        
+        # Lookup tables for batch sampling
+        self._states = np.array(self.states, dtype=object)
+        self._zip3 = np.array(self._zip3_pool, dtype=object)
+        self._genders = np.array(list(self.gender_weights), dtype=object)
+        gender_weights = np.array(list(self.gender_weights.values()))
+        self._gender_p = gender_weights / gender_weights.sum()
+        # Birth dates span the last 100 years
+        self._max_age_days = int(100 * 365.25)
     
-    def generate_patient(self, patient_id: str = None) -> PatientSchema:
+    def generate_patient(self, patient_id: str = None) -> PatientRecord:
         """Generate a single patient record"""
         if patient_id is None:
-            patient_id = f"PAT{self.fake.unique.random_int(min=100000, max=999999)}"
+            patient_id = f"PAT{next(self._pat_counter)}"
         
         # Generate date of birth (ages 0-100)
-        birth_date = self.fake.date_between(
-            start_date='-100y',
-            end_date='today'
-        )
+        birth_date = self._today - timedelta(days=random.randint(0, self._max_age_days))
         
         # Realistic gender distribution
-        gender = random.choices(
-            list(self.gender_weights.keys()),
-            weights=list(self.gender_weights.values())
-        )[0]
+        gender = self._gender_keys[bisect(self._gender_cum, random.random() * self._gender_cum[-1])]
         
         # Generate ZIP (first 3 digits for privacy - HIPAA compliant)
-        zip_code = self.fake.zipcode()[:3]
+        zip_code = random.choice(self._zip3_pool)
         state = random.choice(self.states)
         
-        return PatientSchema(
+        return PatientRecord(
             patient_id=patient_id,
             date_of_birth=birth_date,
             gender=gender,
@@ -62,13 +107,86 @@ class PatientGenerator:
             state=state
         )
     
-    def generate_patients(self, count: int, start_id: int = 100000) -> List[PatientSchema]:
+    @staticmethod
+    def patient_ids(count: int, start_id: int = 100000) -> List[str]:
+        """Patient IDs assigned by generate_patients/iter_patients"""
+        return [f"PAT{start_id + i}" for i in range(count)]
+    
+    def _sample_patient_columns(self, start_id: int, count: int) -> Dict[str, np.ndarray]:
+        """
+        Sample patients PAT{start_id}..PAT{start_id + count - 1} as columns (structure of arrays)
+        
+        Birth dates, genders, ZIP prefixes and states are each drawn once as
+        a NumPy array of length count.
+        
+        Returns:
+            One array per PatientRecord field, in field order
+        """
+        age_days, gender_idx, zip_idx, state_idx = _build_patient_arrays(
+            self.rng, count, self._max_age_days, self._gender_p, len(self._zip3), len(self._states)
+        )
+        today = np.datetime64(self._today, 'D')
+        birth_dates = today - age_days.astype('timedelta64[D]')
+        
+        return {
+            'patient_id': np.array(self.patient_ids(count, start_id), dtype=object),
+            'date_of_birth': birth_dates,
+            'gender': self._genders[gender_idx],
+            'zip_code': self._zip3[zip_idx],
+            'state': self._states[state_idx],
+            'created_at': np.full(count, np.datetime64(datetime.now(), 'us')),
+        }
+    
+    @staticmethod
+    def patients_from_columns(columns: Dict[str, np.ndarray]) -> List[PatientRecord]:
+        """Build PatientRecord objects from a batch produced by _sample_patient_columns"""
+        rows = list(zip(*(values.tolist() for values in columns.values())))
+        return msgspec.convert(rows, List[PatientRecord])
+    
+    def iter_patients(
+        self,
+        count: int,
+        start_id: int = 100000,
+        batch_size: int = 10000
+    ) -> Iterator[PatientRecord]:
+        """
+        Lazily generate multiple patient records
+        
+        Args:
+            batch_size: Number of patients sampled per vectorized batch
+        """
+        for columns in self.iter_patient_columns(count, start_id, batch_size):
+            yield from self.patients_from_columns(columns)
+    
+    def iter_patient_columns(
+        self,
+        count: int,
+        start_id: int = 100000,
+        batch_size: int = 10000
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Lazily generate patients as columnar batches
+        
+        Args:
+            batch_size: Number of patients sampled per vectorized batch
+        """
+        for offset in range(0, count, batch_size):
+            yield self._sample_patient_columns(start_id + offset, min(batch_size, count - offset))
+    
+    def generate_patients_arrow(self, count: int, start_id: int = 100000) -> pa.Table:
+        """Generate multiple patients as an Arrow table, without building records"""
+        schema = arrow_schema(PatientRecord, self.CATEGORICAL_FIELDS)
+        return pa.Table.from_batches(
+            [
+                pa.RecordBatch.from_pydict(columns, schema=schema)
+                for columns in self.iter_patient_columns(count, start_id)
+            ],
+            schema=schema
+        )
+    
+    def generate_patients(self, count: int, start_id: int = 100000) -> List[PatientRecord]:
         """Generate multiple patient records"""
-        patients = []
-        for i in range(count):
-            patient_id = f"PAT{start_id + i}"
-            patients.append(self.generate_patient(patient_id))
-        return patients
+        return list(self.iter_patients(count, start_id))
 
 
 if __name__ == "__main__":
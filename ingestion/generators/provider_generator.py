@@ -3,14 +3,37 @@ Provider data generator
 Generates healthcare provider information with realistic NPI numbers
 """
 
-from typing import List
+from bisect import bisect
+import itertools
+from typing import Iterator, List, Optional
 import random
+import sys
+import numpy as np
 from faker import Faker
 from faker.providers import company, address
 
 from ingestion.schemas import ProviderSchema
 
 
+# Luhn contribution of a doubled digit (2d with its digits summed)
+LUHN_DOUBLE = np.array([(2 * d) // 10 + (2 * d) % 10 for d in range(10)], dtype=np.int8)
+# Luhn sum of the "80840" prefix the NPI check digit is computed over
+NPI_PREFIX_SUM = 24
+# Place value of each of the 9 base digits
+_NPI_PLACES = 10 ** np.arange(8, -1, -1, dtype=np.int64)
+
+
+def _npi_check_digits(digits: np.ndarray) -> np.ndarray:
+    """
+    Luhn check digits for a (count, 9) array of NPI base digits
+    
+    Digits in even positions (rightmost base digit first) are doubled via
+    LUHN_DOUBLE; the "80840" card-issuer prefix contributes a constant 24.
+    """
+    total = NPI_PREFIX_SUM + LUHN_DOUBLE[digits[:, 0::2]].sum(axis=1) + digits[:, 1::2].sum(axis=1)
+    return (10 - total % 10) % 10
+
+
 class ProviderGenerator:
     """Generate synthetic healthcare provider data"""
     
@@ -19,6 +42,9 @@ class ProviderGenerator:
         if seed:
             Faker.seed(seed)
             random.seed(seed)
+        self.rng = np.random.default_rng(seed)
+        # Default IDs for generate_provider calls without one
+        self._prov_counter = itertools.count(10000)
         self.fake.add_provider(company)
         self.fake.add_provider(address)
         
@@ -32,6 +58,10 @@ class ProviderGenerator:
             'LABORATORY': 0.03,
             'IMAGING': 0.02
         }
+        # Interned so every generated record shares one object per value
+        self.provider_types = {sys.intern(ptype): weight for ptype, weight in self.provider_types.items()}
+        self._type_keys = list(self.provider_types)
+        self._type_cum = list(itertools.accumulate(self.provider_types.values()))
         
         # Medical specialties
         self.specialties = [
@@ -40,37 +70,39 @@ class ProviderGenerator:
             'SURGERY', 'RADIOLOGY', 'PATHOLOGY', 'ANESTHESIOLOGY', 'PSYCHIATRY',
             'DERMATOLOGY', 'OPHTHALMOLOGY', 'UROLOGY', 'GYNECOLOGY', 'PULMONOLOGY'
         ]
+        self.specialties = [sys.intern(specialty) for specialty in self.specialties]
         
         # US states
         self.states = [
             'CA', 'TX', 'FL', 'NY', 'PA', 'IL', 'OH', 'GA', 'NC', 'MI',
             'NJ', 'VA', 'WA', 'AZ', 'MA', 'TN', 'IN', 'MO', 'MD', 'WI'
         ]
+        self.states = [sys.intern(state) for state in self.states]
     
     def generate_npi(self) -> str:
         """
         Generate a realistic NPI (National Provider Identifier)
         NPI format: 10 digits, first digit is 1 or 2
-        Uses Luhn algorithm for validation (simplified version)
+        The last digit is the Luhn check digit
         """
-        # First digit: 1 (individual) or 2 (organization)
-        first_digit = random.choice(['1', '2'])
-        
-        # Generate remaining 9 digits
-        remaining = ''.join([str(random.randint(0, 9)) for _ in range(9)])
-        
-        npi = first_digit + remaining
-        return npi
+        # First digit: 1 (individual) or 2 (organization), then 8 more base digits
+        base = [random.randint(1, 2)] + [random.randint(0, 9) for _ in range(8)]
+        check = _npi_check_digits(np.array([base], dtype=np.int8))[0]
+        return ''.join(map(str, base)) + str(check)
+    
+    def generate_npis(self, count: int) -> List[str]:
+        """Generate `count` NPIs at once (same format as generate_npi)"""
+        digits = self.rng.integers(0, 10, size=(count, 9), dtype=np.int8)
+        digits[:, 0] = self.rng.integers(1, 3, size=count, dtype=np.int8)
+        npis = (digits @ _NPI_PLACES) * 10 + _npi_check_digits(digits)
+        return npis.astype(str).tolist()
     
-    def generate_provider(self, provider_id: str = None) -> ProviderSchema:
+    def generate_provider(self, provider_id: str = None, npi: Optional[str] = None) -> ProviderSchema:
         """Generate a single provider record"""
         if provider_id is None:
-            provider_id = f"PROV{self.fake.unique.random_int(min=10000, max=99999)}"
+            provider_id = f"PROV{next(self._prov_counter)}"
         
-        provider_type = random.choices(
-            list(self.provider_types.keys()),
-            weights=list(self.provider_types.values())
-        )[0]
+        provider_type = self._type_keys[bisect(self._type_cum, random.random() * self._type_cum[-1])]
         
         # Generate provider name based on type
         if provider_type == 'HOSPITAL':
@@ -93,7 +125,7 @@ class ProviderGenerator:
         
         return ProviderSchema(
             provider_id=provider_id,
-            npi=self.generate_npi(),
+            npi=npi if npi is not None else self.generate_npi(),
             provider_name=name,
             provider_type=provider_type,
             specialty=specialty,
@@ -103,13 +135,20 @@ class ProviderGenerator:
             zip_code=zip_code
         )
     
+    @staticmethod
+    def provider_ids(count: int, start_id: int = 10000) -> List[str]:
+        """Provider IDs assigned by generate_providers/iter_providers"""
+        return [f"PROV{start_id + i}" for i in range(count)]
+    
+    def iter_providers(self, count: int, start_id: int = 10000) -> Iterator[ProviderSchema]:
+        """Lazily generate multiple provider records"""
+        npis = self.generate_npis(count)
+        for provider_id, npi in zip(self.provider_ids(count, start_id), npis):
+            yield self.generate_provider(provider_id, npi)
+    
     def generate_providers(self, count: int, start_id: int = 10000) -> List[ProviderSchema]:
         """Generate multiple provider records"""
-        providers = []
-        for i in range(count):
-            provider_id = f"PROV{start_id + i}"
-            providers.append(self.generate_provider(provider_id))
-        return providers
+        return list(self.iter_providers(count, start_id))
 
 
 if __name__ == "__main__":
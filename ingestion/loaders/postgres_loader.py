@@ -3,117 +3,656 @@ PostgreSQL data loader
 Loads CSV files into raw Postgres tables
 """
 
-import pandas as pd
+import asyncio
+import csv
+import io
+import mmap
+import os
+import shutil
+import struct
+import subprocess
+import threading
+from decimal import Decimal
+from functools import cached_property
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from pathlib import Path
-from typing import List, Optional
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 import structlog
-from sqlalchemy import text, inspect
+from sqlalchemy import URL, Inspector, text, inspect
+from sqlalchemy.exc import DBAPIError
 
 from database.connection import db_manager
+from ingestion.schemas import (
+    CPTSchema,
+    ClaimSchema,
+    ICD10Schema,
+    NoteSchema,
+    PatientSchema,
+    ProviderSchema,
+    arrow_schema,
+    validate_batch,
+)
 
 logger = structlog.get_logger()
 
+# Binary COPY framing: signature, flags and header-extension length
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\0" + struct.pack(">ii", 0, 0)
+PGCOPY_TRAILER = struct.pack(">h", -1)
+_NULL_FIELD = struct.pack(">i", -1)
+_PG_EPOCH_US = np.datetime64("2000-01-01", "us").astype(np.int64)
+_PG_EPOCH_DAYS = np.datetime64("2000-01-01", "D").astype(np.int64)
+
+# Raw-layer columns stored as DECIMAL(12, 2) (floats in the Pydantic schemas)
+DECIMAL_COLUMNS = frozenset({'total_charge', 'total_paid'})
+
+# Files larger than this are COPYed as several concurrent byte ranges
+COPY_RANGE_BYTES = 256 << 20
+COPY_MAX_STREAMS = 4
+
+# Parquet raw layer: rows per row group and the parquet_fdw server name
+PARQUET_ROW_GROUP_SIZE = 128_000
+PARQUET_SERVER = "parquet_srv"
+
+# Postgres column type for each Arrow type in the raw schemas
+PG_COLUMN_TYPES: Dict[pa.DataType, str] = {
+    pa.string(): "TEXT",
+    pa.date32(): "DATE",
+    pa.timestamp('us'): "TIMESTAMP",
+    pa.decimal128(12, 2): "DECIMAL(12, 2)",
+    pa.bool_(): "BOOLEAN",
+}
+
+# Connections in the asyncpg pool used by aload_all_raw_data
+ASYNC_POOL_SIZE = 8
+
+# Read buffer for CSV files; readahead hints are given where the OS supports them
+CSV_READ_BUFFER = 8 << 20
+USE_FADVISE = hasattr(os, "posix_fadvise")
+
+# Arrow CSV reader block size; larger blocks mean fewer, bigger batches
+CSV_BLOCK_SIZE = 32 << 20
+
+
+def _numeric_send(value: str) -> bytes:
+    """
+    Encode a decimal string in Postgres's numeric_send layout
+    
+    dscale is the number of digits the string has after the point, so
+    "1.5" and "1.50" differ only in dscale; numeric_recv rounds either to
+    the column's declared scale.
+    """
+    sign, digits, exponent = Decimal(value).as_tuple()
+    digits = ''.join(map(str, digits))
+    dscale = max(0, -exponent)
+    if exponent >= 0:
+        int_part, frac_part = digits + '0' * exponent, ''
+    else:
+        split = len(digits) + exponent
+        int_part = digits[:max(split, 0)]
+        frac_part = '0' * max(-split, 0) + digits[max(split, 0):]
+    
+    # Base-10000 groups, aligned on the decimal point
+    int_part = int_part.zfill(-(-len(int_part) // 4) * 4)
+    frac_part = frac_part.ljust(-(-len(frac_part) // 4) * 4, '0')
+    groups = [int(int_part[i:i + 4]) for i in range(0, len(int_part), 4)]
+    weight = len(groups) - 1
+    groups += [int(frac_part[i:i + 4]) for i in range(0, len(frac_part), 4)]
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+    
+    payload = struct.pack(f">hhHH{len(groups)}H", len(groups), weight, 0x4000 if sign else 0, dscale, *groups)
+    return struct.pack(">i", len(payload)) + payload
+
+
+def _encode_text(values: pa.Array) -> List[bytes]:
+    fields = []
+    for value in values.to_pylist():
+        if value is None:
+            fields.append(_NULL_FIELD)
+        else:
+            data = value.encode('utf-8')
+            fields.append(struct.pack(">i", len(data)) + data)
+    return fields
+
+
+def _encode_offsets(values: pa.Array, offsets: np.ndarray, fmt: str) -> List[bytes]:
+    field = struct.Struct(fmt)
+    size = field.size - 4
+    missing = values.is_null().to_numpy(zero_copy_only=False).tolist()
+    return [_NULL_FIELD if null else field.pack(size, offset) for offset, null in zip(offsets.tolist(), missing)]
+
+
+def _encode_date(values: pa.Array) -> List[bytes]:
+    """Days since 2000-01-01"""
+    days = values.cast(pa.int32()).fill_null(0).to_numpy()
+    return _encode_offsets(values, days - _PG_EPOCH_DAYS, ">ii")
+
+
+def _encode_timestamp(values: pa.Array) -> List[bytes]:
+    """Microseconds since 2000-01-01"""
+    micros = values.cast(pa.int64()).fill_null(0).to_numpy()
+    return _encode_offsets(values, micros - _PG_EPOCH_US, ">iq")
+
+
+def _numeric_from_unscaled(unscaled: int, scale: int) -> bytes:
+    """
+    numeric_send layout for unscaled / 10**scale, using integer arithmetic only
+    
+    dscale is always scale (the column's), not the value's significant
+    digits: 150 at scale 2 gives dscale 2, as _numeric_send("1.50") does,
+    while _numeric_send("1.5") gives dscale 1. The two load identically.
+    """
+    whole, frac = divmod(abs(unscaled), 10 ** scale)
+    groups = []
+    while whole:
+        whole, group = divmod(whole, 10000)
+        groups.append(group)
+    groups.reverse()
+    weight = len(groups) - 1
+    
+    # Fractional digits padded out to whole base-10000 groups
+    frac_groups = -(-scale // 4)
+    frac *= 10 ** (frac_groups * 4 - scale)
+    groups += [(frac // 10000 ** i) % 10000 for i in range(frac_groups - 1, -1, -1)]
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+    
+    sign = 0x4000 if unscaled < 0 else 0
+    payload = struct.pack(f">hhHH{len(groups)}H", len(groups), weight, sign, scale, *groups)
+    return struct.pack(">i", len(payload)) + payload
+
+
+def _encode_numeric(values: pa.Array) -> List[bytes]:
+    if values.type.precision > 18:
+        return [
+            _NULL_FIELD if value is None else _numeric_send(str(value))
+            for value in values.to_pylist()
+        ]
+    
+    # Up to 18 digits the unscaled value (e.g. cents) fits in the low
+    # 64 bits of each little-endian decimal128 slot, so read those directly
+    # instead of boxing every value as a Decimal
+    words = np.frombuffer(values.buffers()[1], dtype="<i8")
+    unscaled = words[2 * values.offset:2 * (values.offset + len(values)):2].tolist()
+    missing = values.is_null().to_numpy(zero_copy_only=False).tolist()
+    scale = values.type.scale
+    return [
+        _NULL_FIELD if null else _numeric_from_unscaled(value, scale)
+        for value, null in zip(unscaled, missing)
+    ]
+
+
+def _encode_bool(values: pa.Array) -> List[bytes]:
+    true, false = struct.pack(">iB", 1, 1), struct.pack(">iB", 1, 0)
+    return [
+        _NULL_FIELD if value is None else (true if value else false)
+        for value in values.to_pylist()
+    ]
+
+
+# Binary COPY encoder for each Arrow type in the raw schemas
+COLUMN_ENCODERS: Dict[pa.DataType, Callable[[pa.Array], List[bytes]]] = {
+    pa.string(): _encode_text,
+    pa.date32(): _encode_date,
+    pa.timestamp('us'): _encode_timestamp,
+    pa.decimal128(12, 2): _encode_numeric,
+    pa.bool_(): _encode_bool,
+}
+
+
+# Raw tables in report order; each has a matching <table>.csv file
+RAW_TABLES = (
+    "raw_patients",
+    "raw_providers",
+    "raw_claims",
+    "raw_notes",
+    "raw_icd10",
+    "raw_cpt",
+)
+
+# Pydantic schema describing each raw table's columns
+RAW_TABLE_SCHEMAS = {
+    "raw_patients": PatientSchema,
+    "raw_providers": ProviderSchema,
+    "raw_claims": ClaimSchema,
+    "raw_notes": NoteSchema,
+    "raw_icd10": ICD10Schema,
+    "raw_cpt": CPTSchema,
+}
+
+# Load order: each wave only references tables loaded in earlier waves
+LOAD_WAVES = (
+    ("raw_patients", "raw_providers", "raw_icd10", "raw_cpt"),
+    ("raw_claims",),
+    ("raw_notes",),
+)
+
+
+# Raw layer tables with primary keys only (UNLOGGED staging copies of the
+# CSV files); earlier runs' foreign keys and secondary indexes are dropped
+CREATE_RAW_TABLES_SQL = """
+-- Raw Patients Table
+CREATE UNLOGGED TABLE IF NOT EXISTS raw_patients (
+    patient_id VARCHAR(50) PRIMARY KEY,
+    date_of_birth DATE,
+    gender VARCHAR(1),
+    zip_code VARCHAR(10),
+    state VARCHAR(2),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Raw Providers Table
+CREATE UNLOGGED TABLE IF NOT EXISTS raw_providers (
+    provider_id VARCHAR(50) PRIMARY KEY,
+    npi VARCHAR(10),
+    provider_name VARCHAR(255),
+    provider_type VARCHAR(50),
+    specialty VARCHAR(100),
+    address VARCHAR(255),
+    city VARCHAR(100),
+    state VARCHAR(2),
+    zip_code VARCHAR(10),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Raw Claims Table
+CREATE UNLOGGED TABLE IF NOT EXISTS raw_claims (
+    claim_id VARCHAR(50) PRIMARY KEY,
+    patient_id VARCHAR(50),
+    provider_id VARCHAR(50),
+    claim_date DATE,
+    admission_date DATE,
+    discharge_date DATE,
+    claim_type VARCHAR(50),
+    total_charge DECIMAL(12, 2),
+    total_paid DECIMAL(12, 2),
+    claim_status VARCHAR(50),
+    denial_reason VARCHAR(100),
+    primary_diagnosis_code VARCHAR(20),
+    primary_procedure_code VARCHAR(20),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Raw Notes Table
+CREATE UNLOGGED TABLE IF NOT EXISTS raw_notes (
+    note_id VARCHAR(50) PRIMARY KEY,
+    claim_id VARCHAR(50),
+    note_type VARCHAR(50),
+    note_text TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Raw ICD-10 Lookup Table
+CREATE UNLOGGED TABLE IF NOT EXISTS raw_icd10 (
+    code VARCHAR(20) PRIMARY KEY,
+    description TEXT,
+    category VARCHAR(100),
+    is_valid BOOLEAN DEFAULT TRUE
+);
+
+-- Raw CPT Lookup Table
+CREATE UNLOGGED TABLE IF NOT EXISTS raw_cpt (
+    code VARCHAR(20) PRIMARY KEY,
+    description TEXT,
+    category VARCHAR(100),
+    is_valid BOOLEAN DEFAULT TRUE
+);
+
+-- Drop load-time overhead from tables created by an earlier run
+ALTER TABLE raw_notes DROP CONSTRAINT IF EXISTS raw_notes_claim_id_fkey;
+ALTER TABLE raw_claims DROP CONSTRAINT IF EXISTS raw_claims_patient_id_fkey;
+ALTER TABLE raw_claims DROP CONSTRAINT IF EXISTS raw_claims_provider_id_fkey;
+DROP INDEX IF EXISTS idx_claims_patient;
+DROP INDEX IF EXISTS idx_claims_provider;
+DROP INDEX IF EXISTS idx_claims_status;
+DROP INDEX IF EXISTS idx_notes_claim;
+"""
+
+# Raw layer foreign keys, added once the data is in
+RAW_CONSTRAINTS_SQL = """
+-- Foreign keys (validated against the loaded rows)
+ALTER TABLE raw_claims DROP CONSTRAINT IF EXISTS raw_claims_patient_id_fkey;
+ALTER TABLE raw_claims ADD CONSTRAINT raw_claims_patient_id_fkey
+    FOREIGN KEY (patient_id) REFERENCES raw_patients(patient_id);
+ALTER TABLE raw_claims DROP CONSTRAINT IF EXISTS raw_claims_provider_id_fkey;
+ALTER TABLE raw_claims ADD CONSTRAINT raw_claims_provider_id_fkey
+    FOREIGN KEY (provider_id) REFERENCES raw_providers(provider_id);
+ALTER TABLE raw_notes DROP CONSTRAINT IF EXISTS raw_notes_claim_id_fkey;
+ALTER TABLE raw_notes ADD CONSTRAINT raw_notes_claim_id_fkey
+    FOREIGN KEY (claim_id) REFERENCES raw_claims(claim_id);
+"""
+
+# Secondary indexes (name, table, column), built after the load
+RAW_INDEXES = (
+    ("idx_claims_patient", "raw_claims", "patient_id"),
+    ("idx_claims_provider", "raw_claims", "provider_id"),
+    ("idx_claims_status", "raw_claims", "claim_status"),
+    ("idx_notes_claim", "raw_notes", "claim_id"),
+)
+
+# Raw tables are reloaded from CSV, so load transactions don't wait for WAL flushes
+LOAD_TRANSACTION_SQL = "SET LOCAL synchronous_commit = OFF"
+
+
+def raw_arrow_schema(table_name: str) -> pa.Schema:
+    """Arrow column types for a raw table, from its Pydantic schema"""
+    schema = arrow_schema(RAW_TABLE_SCHEMAS[table_name])
+    for name in DECIMAL_COLUMNS.intersection(schema.names):
+        index = schema.get_field_index(name)
+        schema = schema.set(index, pa.field(name, pa.decimal128(12, 2)))
+    return schema
+
+
+# Declared column types for every raw table, parsed once for all chunks
+TABLE_SCHEMAS: Dict[str, pa.Schema] = {table: raw_arrow_schema(table) for table in RAW_TABLES}
+
+
+def _advise_sequential(fd: int, offset: int = 0, length: int = 0):
+    """Ask the kernel to read [offset, offset + length) ahead (length 0: to the end)"""
+    if USE_FADVISE:
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_WILLNEED)
+
+
+def _open_sequential(csv_path: Path, offset: int = 0, length: int = 0) -> BinaryIO:
+    """Open a file for one sequential pass, with a large read buffer and readahead hints"""
+    f = open(csv_path, 'rb', buffering=CSV_READ_BUFFER)
+    _advise_sequential(f.fileno(), offset, length)
+    return f
+
+
+def _open_arrow_sequential(csv_path: Path) -> pa.NativeFile:
+    """
+    Arrow-native buffered stream over a file, with readahead hints
+    
+    Arrow keeps its own file descriptor, so the hints are given through a
+    second one; WILLNEED still populates the shared page cache. (Handing
+    Arrow a Python file object instead would route its background reads
+    through the interpreter.)
+    """
+    fd = os.open(csv_path, os.O_RDONLY)
+    try:
+        _advise_sequential(fd)
+    finally:
+        os.close(fd)
+    return pa.input_stream(str(csv_path), buffer_size=CSV_READ_BUFFER)
+
+
+def _iter_csv_batches(csv_path: Path, table_name: str, chunk_size: int) -> Iterator[pa.RecordBatch]:
+    """
+    Stream a raw CSV file as record batches of at most chunk_size rows
+    
+    Columns are parsed with the table's explicit Arrow types, so no type
+    inference runs; empty fields are read as NULL.
+    """
+    with _open_arrow_sequential(csv_path) as f:
+        reader = pa_csv.open_csv(
+            f,
+            read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=TABLE_SCHEMAS[table_name],
+                strings_can_be_null=True
+            )
+        )
+        for batch in reader:
+            for offset in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(offset, chunk_size)
+
+
+def _split_csv_by_bytes(csv_path: Path, n_chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split a CSV file's data rows into about n_chunks (start, end) byte ranges
+    
+    The file is memory-mapped and each target offset is moved forward to
+    the next newline that ends a record. Quoted fields (e.g. note text) can
+    contain newlines, so a newline only counts when an even number of quote
+    characters precede it. The header row is excluded.
+    """
+    with open(csv_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            def record_end(pos: int, scanned: int, quotes: int) -> Tuple[int, int, int]:
+                """First record-ending newline at or after pos (with the running quote count)"""
+                while True:
+                    newline = mm.find(b'\n', pos)
+                    if newline < 0:
+                        return size, size, quotes
+                    quotes += mm[scanned:newline].count(b'"')
+                    scanned = newline
+                    if quotes % 2 == 0:
+                        return newline + 1, scanned, quotes
+                    pos = newline + 1
+            
+            start, scanned, quotes = record_end(0, 0, 0)
+            boundaries = [start]
+            step = max(1, (size - start) // max(1, n_chunks))
+            for i in range(1, n_chunks):
+                target = start + i * step
+                if target <= boundaries[-1]:
+                    continue
+                end, scanned, quotes = record_end(target, scanned, quotes)
+                if end >= size:
+                    break
+                boundaries.append(end)
+            boundaries.append(size)
+    
+    return [(lo, hi) for lo, hi in zip(boundaries, boundaries[1:]) if hi > lo]
+
+
+def convert_csv_to_parquet(csv_path: Path, table_name: str, parquet_path: Optional[Path] = None) -> Tuple[Path, int]:
+    """
+    Rewrite a raw CSV file as ZSTD-compressed Parquet with the table's types
+    
+    The file is streamed through the Arrow CSV reader, one row group per
+    PARQUET_ROW_GROUP_SIZE rows.
+    
+    Returns:
+        (Parquet path, rows written)
+    """
+    if parquet_path is None:
+        parquet_path = csv_path.with_suffix(".parquet")
+    total_rows = 0
+    with pq.ParquetWriter(parquet_path, TABLE_SCHEMAS[table_name], compression="zstd") as writer:
+        for batch in _iter_csv_batches(csv_path, table_name, PARQUET_ROW_GROUP_SIZE):
+            writer.write_batch(batch, row_group_size=PARQUET_ROW_GROUP_SIZE)
+            total_rows += batch.num_rows
+    return parquet_path, total_rows
+
+
+def _iter_raw_row_chunks(csv_path: Path, table_name: str, chunk_size: int = 10000) -> Iterator[List[tuple]]:
+    """Validated row tuples of a raw CSV file (date, datetime, Decimal, bool and str values), a chunk at a time"""
+    for batch in _iter_csv_batches(csv_path, table_name, chunk_size):
+        validate_batch(batch, RAW_TABLE_SCHEMAS[table_name])
+        yield list(zip(*(column.to_pylist() for column in batch.columns)))
+
+
+async def _aiter_raw_rows(csv_path: Path, table_name: str, chunk_size: int = 10000) -> AsyncIterator[tuple]:
+    """
+    Row tuples of a raw CSV file for asyncpg
+    
+    Each chunk is read, parsed and validated in a worker thread, so the
+    file I/O and Arrow work don't block the event loop.
+    """
+    chunks = _iter_raw_row_chunks(csv_path, table_name, chunk_size)
+    try:
+        while (rows := await asyncio.to_thread(next, chunks, None)) is not None:
+            for row in rows:
+                yield row
+    finally:
+        chunks.close()
+
+
+class _FileRange:
+    """Read-only view of the next `length` bytes of an open file (for copy_expert)"""
+    
+    def __init__(self, f, length: int):
+        self._f = f
+        self._remaining = length
+    
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._f.read(size)
+        self._remaining -= len(data)
+        return data
+
 
 class PostgresLoader:
     """Loads data from CSV files into Postgres raw tables"""
     
+    # Date- and decimal-heavy tables sent pre-encoded in binary COPY format
+    BINARY_COPY_TABLES = frozenset({"raw_claims"})
+    
+    # Tables whose files psql can \copy as-is, with no Python in the data path
+    PSQL_COPY_TABLES = frozenset({"raw_icd10", "raw_cpt"})
+    
+    # Small lookup tables reloaded whole every run: truncated and copied
+    # WITH (FREEZE) in one transaction (nothing references them)
+    FREEZE_COPY_TABLES = frozenset({"raw_icd10", "raw_cpt"})
+    
     def __init__(self):
         self.engine = db_manager.get_engine()
+        self._index_thread: Optional[threading.Thread] = None
+    
+    @contextmanager
+    def _transaction(self, conn=None):
+        """
+        Raw DBAPI connection for one load transaction
+        
+        With an external conn the caller owns the transaction: it is yielded
+        as-is and neither committed nor closed here.
+        """
+        if conn is not None:
+            yield conn
+            return
+        conn = self.engine.raw_connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+    
+    @cached_property
+    def inspector(self) -> Inspector:
+        """Schema inspector, created on first use and reused (it caches reflected metadata)"""
+        return inspect(self.engine)
     
     def create_raw_tables(self):
-        """Create raw layer tables if they don't exist"""
-        logger.info("Creating raw layer tables")
+        """Create raw layer tables if they don't exist, with keys and indexes"""
+        self.create_raw_tables_bare()
+        self.finalize_raw_constraints()
+        self.create_raw_indexes()
+    
+    def create_raw_tables_bare(self):
+        """
+        Create raw layer tables with primary keys only
+        
+        The tables are UNLOGGED: they are staging copies of the CSV files,
+        so they skip WAL (and are emptied if the server crashes).
         
-        create_tables_sql = """
-        -- Raw Patients Table
-        CREATE TABLE IF NOT EXISTS raw_patients (
-            patient_id VARCHAR(50) PRIMARY KEY,
-            date_of_birth DATE,
-            gender VARCHAR(1),
-            zip_code VARCHAR(10),
-            state VARCHAR(2),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        -- Raw Providers Table
-        CREATE TABLE IF NOT EXISTS raw_providers (
-            provider_id VARCHAR(50) PRIMARY KEY,
-            npi VARCHAR(10),
-            provider_name VARCHAR(255),
-            provider_type VARCHAR(50),
-            specialty VARCHAR(100),
-            address VARCHAR(255),
-            city VARCHAR(100),
-            state VARCHAR(2),
-            zip_code VARCHAR(10),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        -- Raw Claims Table
-        CREATE TABLE IF NOT EXISTS raw_claims (
-            claim_id VARCHAR(50) PRIMARY KEY,
-            patient_id VARCHAR(50),
-            provider_id VARCHAR(50),
-            claim_date DATE,
-            admission_date DATE,
-            discharge_date DATE,
-            claim_type VARCHAR(50),
-            total_charge DECIMAL(12, 2),
-            total_paid DECIMAL(12, 2),
-            claim_status VARCHAR(50),
-            denial_reason VARCHAR(100),
-            primary_diagnosis_code VARCHAR(20),
-            primary_procedure_code VARCHAR(20),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (patient_id) REFERENCES raw_patients(patient_id),
-            FOREIGN KEY (provider_id) REFERENCES raw_providers(provider_id)
-        );
-        
-        -- Raw Notes Table
-        CREATE TABLE IF NOT EXISTS raw_notes (
-            note_id VARCHAR(50) PRIMARY KEY,
-            claim_id VARCHAR(50),
-            note_type VARCHAR(50),
-            note_text TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (claim_id) REFERENCES raw_claims(claim_id)
-        );
-        
-        -- Raw ICD-10 Lookup Table
-        CREATE TABLE IF NOT EXISTS raw_icd10 (
-            code VARCHAR(20) PRIMARY KEY,
-            description TEXT,
-            category VARCHAR(100),
-            is_valid BOOLEAN DEFAULT TRUE
-        );
-        
-        -- Raw CPT Lookup Table
-        CREATE TABLE IF NOT EXISTS raw_cpt (
-            code VARCHAR(20) PRIMARY KEY,
-            description TEXT,
-            category VARCHAR(100),
-            is_valid BOOLEAN DEFAULT TRUE
-        );
-        
-        -- Create indexes for performance
-        CREATE INDEX IF NOT EXISTS idx_claims_patient ON raw_claims(patient_id);
-        CREATE INDEX IF NOT EXISTS idx_claims_provider ON raw_claims(provider_id);
-        CREATE INDEX IF NOT EXISTS idx_claims_status ON raw_claims(claim_status);
-        CREATE INDEX IF NOT EXISTS idx_notes_claim ON raw_notes(claim_id);
+        Foreign keys and secondary indexes left by an earlier run are dropped,
+        so bulk loads don't pay for them row by row; finalize_raw_constraints
+        and create_raw_indexes put them back.
         """
+        logger.info("Creating raw layer tables")
         
         with self.engine.connect() as conn:
-            conn.execute(text(create_tables_sql))
+            conn.execute(text(CREATE_RAW_TABLES_SQL))
             conn.commit()
         
         logger.info("Raw layer tables created successfully")
     
+    def finalize_raw_constraints(self):
+        """Add the raw layer's foreign keys (indexes: create_raw_indexes)"""
+        logger.info("Adding raw layer constraints")
+        
+        with self.engine.connect() as conn:
+            conn.execute(text(RAW_CONSTRAINTS_SQL))
+            conn.commit()
+        
+        logger.info("Raw layer constraints created successfully")
+    
+    def create_raw_indexes(self):
+        """
+        Build the raw layer's secondary indexes with CREATE INDEX CONCURRENTLY
+        
+        CONCURRENTLY can't run inside a transaction block, so each statement
+        runs in autocommit mode; the tables stay readable and writable while
+        the indexes build.
+        """
+        logger.info("Creating raw layer indexes")
+        
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            # Give the index builds room to sort in memory
+            conn.execute(text("SET maintenance_work_mem = '512MB'"))
+            try:
+                for index_name, table_name, column in RAW_INDEXES:
+                    conn.execute(text(
+                        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name}({column})"
+                    ))
+            finally:
+                conn.execute(text("RESET maintenance_work_mem"))
+        
+        logger.info("Raw layer indexes created successfully")
+    
+    def start_raw_index_build(self) -> threading.Thread:
+        """Run create_raw_indexes in a background thread (see wait_for_indexes)"""
+        def build():
+            try:
+                self.create_raw_indexes()
+            except Exception as e:
+                logger.error("Failed to create raw layer indexes", error=str(e))
+        
+        self._index_thread = threading.Thread(target=build, name="raw-index-build")
+        self._index_thread.start()
+        return self._index_thread
+    
+    def wait_for_indexes(self, timeout: Optional[float] = None):
+        """Wait for a background index build started by load_all_raw_data"""
+        if self._index_thread is not None:
+            self._index_thread.join(timeout)
+    
+    def set_raw_tables_logged(self, logged: bool = True):
+        """Switch the raw tables between LOGGED and UNLOGGED (e.g. once ingest is done)"""
+        mode = "LOGGED" if logged else "UNLOGGED"
+        logger.info(f"Setting raw layer tables {mode}")
+        
+        # Referenced tables must be logged before (and unlogged after) their referrers
+        order = LOAD_WAVES if logged else LOAD_WAVES[::-1]
+        with self.engine.connect() as conn:
+            for wave in order:
+                for table in wave:
+                    conn.execute(text(f"ALTER TABLE {table} SET {mode}"))
+            conn.commit()
+    
     def load_csv_to_table(
         self,
         csv_path: Path,
         table_name: str,
         if_exists: str = "replace",
-        chunk_size: int = 10000
+        chunk_size: int = 10000,
+        binary: bool = False,
+        conn=None
     ) -> int:
         """
         Load CSV file into Postgres table
@@ -123,6 +662,9 @@ class PostgresLoader:
             table_name: Target table name
             if_exists: What to do if table exists ('replace', 'append', 'fail')
             chunk_size: Number of rows to process at a time
+            binary: Send chunks in COPY's binary format instead of CSV text
+            conn: psycopg2 connection whose open transaction the load joins
+                (not committed here); by default the file gets its own
             
         Returns:
             Number of rows loaded
@@ -135,84 +677,576 @@ class PostgresLoader:
         
         total_rows = 0
         
-        # Read CSV in chunks for large files
-        for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
-            chunk_rows = len(chunk)
-            
-            # Convert date columns
-            date_columns = ['date_of_birth', 'claim_date', 'admission_date', 'discharge_date', 'created_at']
-            for col in date_columns:
-                if col in chunk.columns:
-                    chunk[col] = pd.to_datetime(chunk[col], errors='coerce')
-            
-            # Load chunk to database
-            chunk.to_sql(
-                name=table_name,
-                con=self.engine,
-                if_exists=if_exists,
-                index=False,
-                method='multi'
-            )
-            
-            total_rows += chunk_rows
-            logger.debug(f"Loaded {chunk_rows} rows (total: {total_rows})")
+        # COPY needs the psycopg2 cursor; other drivers go through to_sql
+        if self.engine.dialect.driver != "psycopg2":
+            return self._load_csv_with_to_sql(csv_path, table_name, if_exists, chunk_size)
+        
+        if if_exists == "fail" and self.inspector.has_table(table_name):
+            raise ValueError(f"Table '{table_name}' already exists.")
+        
+        # One connection and one transaction for the whole file
+        with self._transaction(conn) as conn:
+            with conn.cursor() as cur:
+                cur.execute(LOAD_TRANSACTION_SQL)
+                # No CASCADE: a table other rows still reference fails to
+                # truncate instead of emptying its dependents
+                if if_exists == "replace":
+                    cur.execute(f"TRUNCATE {table_name}")
+                
+                # Read CSV in chunks for large files
+                for chunk in _iter_csv_batches(csv_path, table_name, chunk_size):
+                    chunk_rows = chunk.num_rows
+                    validate_batch(chunk, RAW_TABLE_SCHEMAS[table_name])
+                    
+                    if binary:
+                        self._write_binary_copy(chunk, cur, table_name)
+                    else:
+                        buf = io.BytesIO()
+                        pa_csv.write_csv(chunk, buf, pa_csv.WriteOptions(include_header=False))
+                        buf.seek(0)
+                        cur.copy_expert(
+                            f"COPY {table_name} ({','.join(chunk.schema.names)}) "
+                            "FROM STDIN WITH (FORMAT CSV, NULL '')",
+                            buf
+                        )
+                    
+                    total_rows += chunk_rows
+                    logger.debug(f"Loaded {chunk_rows} rows (total: {total_rows})")
+        
+        logger.info(f"Successfully loaded {total_rows} rows into {table_name}")
+        return total_rows
+    
+    def load_csv_via_copy(
+        self,
+        csv_path: Path,
+        table_name: str,
+        if_exists: str = "replace",
+        n_chunks: int = 1,
+        freeze: bool = False,
+        conn=None
+    ) -> int:
+        """
+        Stream a CSV file straight into Postgres with COPY
+        
+        The file must already match the table's schema: Postgres parses it
+        and no rows pass through pandas. Use load_csv_to_table when columns
+        need converting first.
+        
+        Args:
+            csv_path: Path to CSV file (with a header row)
+            table_name: Target table name
+            if_exists: 'replace' empties the table first, 'append' adds to it
+            n_chunks: Split the file into this many byte ranges and COPY them
+                concurrently, each on its own connection and transaction
+            freeze: TRUNCATE and COPY ... FREEZE in a single transaction,
+                replacing the table's rows whatever if_exists says
+            conn: psycopg2 connection whose open transaction the load joins
+                (not committed here; the file is copied as a single range)
             
-            # After first chunk, append mode
-            if_exists = "append"
+        Returns:
+            Number of rows loaded
+        """
+        if not csv_path.exists():
+            logger.error(f"CSV file not found: {csv_path}")
+            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+        
+        logger.info(f"Copying {csv_path.name} into {table_name}", if_exists=if_exists, n_chunks=n_chunks)
+        
+        # Name the columns from the header so file and table order can differ
+        with open(csv_path, newline='') as f:
+            columns = next(csv.reader(f))
+        options = "FORMAT CSV, NULL ''" + (", FREEZE TRUE" if freeze else "")
+        copy_sql = f"COPY {table_name} ({','.join(columns)}) FROM STDIN WITH ({options})"
+        
+        if if_exists == "replace" and not freeze:
+            with self._transaction(conn) as truncate_conn, truncate_conn.cursor() as cur:
+                cur.execute(f"TRUNCATE {table_name}")
+        
+        # Every range starts after the header row
+        ranges = _split_csv_by_bytes(csv_path, 1 if conn is not None or freeze else n_chunks)
+        if freeze:
+            # FREEZE writes the rows already frozen, so no vacuum pass has to
+            # visit them later. Postgres only allows it when the table was
+            # created or truncated in the same transaction, and only for the
+            # table's owner, so the TRUNCATE is issued right here
+            with self._transaction(conn) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(f"TRUNCATE {table_name}")
+                total_rows = sum(self._copy_range(csv_path, copy_sql, *byte_range, conn=conn) for byte_range in ranges)
+        elif conn is not None:
+            total_rows = sum(self._copy_range(csv_path, copy_sql, *byte_range, conn=conn) for byte_range in ranges)
+        elif len(ranges) > 1:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                total_rows = sum(executor.map(
+                    lambda byte_range: self._copy_range(csv_path, copy_sql, *byte_range), ranges
+                ))
+        else:
+            total_rows = sum(self._copy_range(csv_path, copy_sql, *byte_range) for byte_range in ranges)
+        
+        logger.info(f"Successfully loaded {total_rows} rows into {table_name}")
+        return total_rows
+    
+    def load_csv_via_psql(
+        self,
+        csv_path: Path,
+        table_name: str,
+        if_exists: str = "replace",
+        freeze: bool = False
+    ) -> Optional[int]:
+        """
+        Load a CSV file with a psql \\copy subprocess
+        
+        Only used when the file's header matches the table's columns
+        exactly and psql is installed. With freeze, the table is truncated
+        and copied WITH (FREEZE) in one transaction (see load_csv_via_copy).
+        
+        Returns:
+            Number of rows loaded, or None if psql can't be used (load the
+            file through load_csv_via_copy instead)
+        """
+        with open(csv_path, newline='') as f:
+            header = next(csv.reader(f), None)
+        psql = shutil.which("psql")
+        if psql is None or header != TABLE_SCHEMAS[table_name].names:
+            return None
+        
+        logger.info(f"Copying {csv_path.name} into {table_name} with psql", if_exists=if_exists)
+        
+        # Plain libpq URL; the password goes through the environment, not argv
+        # (URL.set ignores password=None, so the URL is rebuilt without it)
+        engine_url = self.engine.url
+        env = dict(os.environ)
+        if engine_url.password is not None:
+            env["PGPASSWORD"] = str(engine_url.password)
+        url = URL.create(
+            "postgresql",
+            username=engine_url.username,
+            host=engine_url.host,
+            port=engine_url.port,
+            database=engine_url.database,
+            query=engine_url.query
+        ).render_as_string(hide_password=False)
+        
+        quoted_path = str(csv_path).replace("'", "''")
+        command = [psql, url, "-X", "-v", "ON_ERROR_STOP=1"]
+        if freeze:
+            # -1 runs every -c in one transaction, as FREEZE requires
+            command += ["-1", "-c", f"TRUNCATE {table_name}"]
+        elif if_exists == "replace":
+            command += ["-c", f"TRUNCATE {table_name}"]
+        options = "FORMAT CSV, HEADER TRUE, NULL ''" + (", FREEZE TRUE" if freeze else "")
+        command += ["-c", f"\\copy {table_name} ({','.join(header)}) FROM '{quoted_path}' WITH ({options})"]
+        result = subprocess.run(command, env=env, check=True, capture_output=True, text=True)
+        
+        # psql reports "COPY <rows>"
+        total_rows = int(result.stdout.split()[-1])
+        logger.info(f"Successfully loaded {total_rows} rows into {table_name}")
+        return total_rows
+    
+    def _copy_range(self, csv_path: Path, copy_sql: str, start: int, end: int, conn=None) -> int:
+        """COPY bytes [start, end) of a CSV file in one transaction (or in conn's)"""
+        with self._transaction(conn) as conn, conn.cursor() as cur, _open_sequential(csv_path, start, end - start) as f:
+            cur.execute(LOAD_TRANSACTION_SQL)
+            f.seek(start)
+            cur.copy_expert(copy_sql, _FileRange(f, end - start))
+            return cur.rowcount
+    
+    @staticmethod
+    def _write_binary_copy(batch: pa.RecordBatch, cur, table_name: str):
+        """COPY a record batch into table_name using the binary COPY format"""
+        # Encode column by column, then stitch each row's fields together
+        encoded = [
+            COLUMN_ENCODERS[column.type](column)
+            for column in batch.columns
+        ]
+        row_header = struct.pack(">h", batch.num_columns)
+        
+        buf = io.BytesIO()
+        buf.write(PGCOPY_HEADER)
+        for fields in zip(*encoded):
+            buf.write(row_header)
+            buf.write(b"".join(fields))
+        buf.write(PGCOPY_TRAILER)
+        buf.seek(0)
+        
+        cur.copy_expert(
+            f"COPY {table_name} ({','.join(batch.schema.names)}) FROM STDIN WITH (FORMAT BINARY)",
+            buf
+        )
+    
+    def _load_csv_with_to_sql(
+        self,
+        csv_path: Path,
+        table_name: str,
+        if_exists: str,
+        chunk_size: int
+    ) -> int:
+        """Load CSV file through pandas to_sql (for drivers without COPY support)"""
+        total_rows = 0
+        
+        # All chunks share one connection and commit together
+        with self.engine.begin() as conn:
+            for batch in _iter_csv_batches(csv_path, table_name, chunk_size):
+                validate_batch(batch, RAW_TABLE_SCHEMAS[table_name])
+                # Dates arrive as datetime64 columns rather than objects
+                chunk = batch.to_pandas(date_as_object=False)
+                chunk_rows = len(chunk)
+                
+                # Load chunk to database
+                chunk.to_sql(
+                    name=table_name,
+                    con=conn,
+                    if_exists=if_exists,
+                    index=False,
+                    method='multi'
+                )
+                
+                total_rows += chunk_rows
+                logger.debug(f"Loaded {chunk_rows} rows (total: {total_rows})")
+                
+                # After first chunk, append mode
+                if_exists = "append"
         
         logger.info(f"Successfully loaded {total_rows} rows into {table_name}")
         return total_rows
     
-    def load_all_raw_data(self, data_dir: Path = Path("data/raw")) -> dict:
+    def _load_raw_file(self, csv_path: Path, table_name: str, if_exists: str, conn=None) -> int:
+        """
+        Load one raw file through the fastest path the driver supports
+        
+        With conn (psycopg2 only), the file is loaded inside that connection's
+        transaction, so the psql and concurrent-range paths are not used.
+        """
+        # The generated files already match the raw schema, so they can be
+        # copied as-is whenever the driver supports COPY
+        if self.engine.dialect.driver != "psycopg2":
+            return self.load_csv_to_table(csv_path, table_name, if_exists=if_exists)
+        if table_name in self.BINARY_COPY_TABLES:
+            return self.load_csv_to_table(csv_path, table_name, if_exists=if_exists, binary=True, conn=conn)
+        freeze = table_name in self.FREEZE_COPY_TABLES
+        if conn is not None:
+            return self.load_csv_via_copy(csv_path, table_name, if_exists=if_exists, freeze=freeze, conn=conn)
+        if table_name in self.PSQL_COPY_TABLES:
+            rows_loaded = self.load_csv_via_psql(csv_path, table_name, if_exists=if_exists, freeze=freeze)
+            if rows_loaded is not None:
+                return rows_loaded
+        n_chunks = min(COPY_MAX_STREAMS, 1 + csv_path.stat().st_size // COPY_RANGE_BYTES)
+        return self.load_csv_via_copy(csv_path, table_name, if_exists=if_exists, n_chunks=n_chunks, freeze=freeze)
+    
+    def _ensure_parquet_server(self) -> bool:
+        """Install parquet_fdw and its server; False if the extension isn't available"""
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS parquet_fdw"))
+                conn.execute(text(
+                    f"CREATE SERVER IF NOT EXISTS {PARQUET_SERVER} FOREIGN DATA WRAPPER parquet_fdw"
+                ))
+                conn.commit()
+        except DBAPIError as e:
+            logger.warning("parquet_fdw is not available", error=str(e))
+            return False
+        return True
+    
+    def create_parquet_foreign_table(self, table_name: str, parquet_path: Path) -> str:
+        """
+        Expose a raw table's Parquet file as the foreign table <table>_parquet
+        
+        The path must be readable by the database server.
+        
+        Returns:
+            Foreign table name
+        """
+        foreign_table = f"{table_name}_parquet"
+        columns = ",\n            ".join(
+            f"{field.name} {PG_COLUMN_TYPES[field.type]}" for field in TABLE_SCHEMAS[table_name]
+        )
+        filename = str(parquet_path.resolve()).replace("'", "''")
+        
+        with self.engine.connect() as conn:
+            conn.execute(text(f"DROP FOREIGN TABLE IF EXISTS {foreign_table}"))
+            conn.execute(text(f"""
+        CREATE FOREIGN TABLE {foreign_table} (
+            {columns}
+        )
+        SERVER {PARQUET_SERVER}
+        OPTIONS (filename '{filename}')
+        """))
+            conn.commit()
+        
+        logger.info(f"Created foreign table {foreign_table}", filename=filename)
+        return foreign_table
+    
+    def load_all_raw_parquet(
+        self,
+        data_dir: Path = Path("data/raw"),
+        max_workers: Optional[int] = None
+    ) -> dict:
+        """
+        Persist the raw layer as Parquet and expose it through parquet_fdw
+        
+        Each raw CSV file is converted to <table>.parquet next to it and
+        mapped to a <table>_parquet foreign table. Falls back to the COPY
+        load when parquet_fdw isn't installed on the server.
+        
+        Returns:
+            Dictionary with load statistics
+        """
+        if not self._ensure_parquet_server():
+            logger.warning("Falling back to COPY ingestion")
+            return self.load_all_raw_data(data_dir, max_workers=max_workers)
+        
+        logger.info("Starting Parquet raw layer conversion", data_dir=str(data_dir))
+        
+        results = {}
+        for table_name in RAW_TABLES:
+            csv_path = data_dir / f"{table_name}.csv"
+            if not csv_path.exists():
+                logger.warning(f"CSV file not found: {csv_path.name}")
+                results[table_name] = {
+                    "status": "skipped",
+                    "reason": "file_not_found"
+                }
+                continue
+            try:
+                parquet_path, rows = convert_csv_to_parquet(csv_path, table_name)
+                foreign_table = self.create_parquet_foreign_table(table_name, parquet_path)
+                results[table_name] = {
+                    "status": "success",
+                    "rows_loaded": rows,
+                    "foreign_table": foreign_table
+                }
+            except Exception as e:
+                logger.error(f"Failed to convert {csv_path.name}", error=str(e))
+                results[table_name] = {
+                    "status": "error",
+                    "error": str(e)
+                }
+        
+        logger.info("Parquet raw layer completed", results=results)
+        return results
+    
+    def load_all_raw_data(
+        self,
+        data_dir: Path = Path("data/raw"),
+        max_workers: Optional[int] = None,
+        mode: str = "copy"
+    ) -> dict:
         """
         Load all raw CSV files into database
         
+        Files are loaded in LOAD_WAVES order; the tables within a wave are
+        loaded concurrently by a process pool. Each wave is all-or-nothing:
+        in this process over psycopg2 it runs in one transaction, and
+        otherwise (each table committing on its own) a failed table gets
+        the wave's tables truncated again, back to their pre-wave state.
+        
         Args:
             data_dir: Directory containing CSV files
+            max_workers: Number of worker processes (default: one per table
+                in the largest wave; 1 loads everything in this process)
+            mode: 'copy' loads the raw tables; 'parquet' converts the files
+                to Parquet foreign tables instead (see load_all_raw_parquet)
             
         Returns:
             Dictionary with load statistics
         """
-        logger.info("Starting raw data ingestion", data_dir=str(data_dir))
+        if mode == "parquet":
+            return self.load_all_raw_parquet(data_dir, max_workers=max_workers)
         
-        # Create tables first
-        self.create_raw_tables()
+        logger.info("Starting raw data ingestion", data_dir=str(data_dir))
         
-        # Mapping of CSV files to table names
-        file_mapping = {
-            "raw_patients.csv": "raw_patients",
-            "raw_providers.csv": "raw_providers",
-            "raw_claims.csv": "raw_claims",
-            "raw_notes.csv": "raw_notes",
-            "raw_icd10.csv": "raw_icd10",
-            "raw_cpt.csv": "raw_cpt",
-        }
+        # Create tables first; keys and indexes are added once the data is in
+        self.create_raw_tables_bare()
         
         results = {}
+        present = []
+        for table_name in RAW_TABLES:
+            if (data_dir / f"{table_name}.csv").exists():
+                present.append(table_name)
+            else:
+                logger.warning(f"CSV file not found: {table_name}.csv")
+                results[table_name] = {
+                    "status": "skipped",
+                    "reason": "file_not_found"
+                }
         
-        for filename, table_name in file_mapping.items():
-            csv_path = data_dir / filename
-            
-            if csv_path.exists():
-                try:
-                    rows_loaded = self.load_csv_to_table(csv_path, table_name, if_exists="replace")
-                    results[table_name] = {
-                        "status": "success",
-                        "rows_loaded": rows_loaded
-                    }
-                except Exception as e:
-                    logger.error(f"Failed to load {filename}", error=str(e))
-                    results[table_name] = {
-                        "status": "error",
-                        "error": str(e)
-                    }
+        # Empty every table being replaced up front, so the waves only append
+        # and concurrent loads never contend for TRUNCATE locks. The foreign
+        # keys were just dropped, so no CASCADE is needed, and tables whose
+        # files are missing keep their rows
+        if present:
+            with self.engine.connect() as conn:
+                conn.execute(text(f"TRUNCATE {', '.join(present)}"))
+                conn.commit()
+        
+        if max_workers is None:
+            max_workers = min(max(len(wave) for wave in LOAD_WAVES), os.cpu_count() or 1)
+        
+        executor = None
+        if max_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_load_worker)
+        try:
+            for wave in LOAD_WAVES:
+                jobs = [(data_dir / f"{table}.csv", table) for table in wave if table in present]
+                if executor is not None:
+                    outcomes = self._rollback_failed_wave(jobs, list(executor.map(_load_worker, jobs)))
+                elif jobs and self.engine.dialect.driver == "psycopg2":
+                    outcomes = self._load_wave(jobs)
+                else:
+                    outcomes = self._rollback_failed_wave(jobs, [_load_worker(job, self) for job in jobs])
+                for (csv_path, table_name), (rows_loaded, error) in zip(jobs, outcomes):
+                    if error is None:
+                        results[table_name] = {
+                            "status": "success",
+                            "rows_loaded": rows_loaded
+                        }
+                    else:
+                        logger.error(f"Failed to load {csv_path.name}", error=error)
+                        results[table_name] = {
+                            "status": "error",
+                            "error": error
+                        }
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        results = {table: results[table] for table in RAW_TABLES}
+        if any(result["status"] == "error" for result in results.values()):
+            # Partially loaded tables may not satisfy the foreign keys
+            logger.warning("Skipping raw layer constraints after failed loads")
+        else:
+            self.finalize_raw_constraints()
+            # Indexes build in the background, e.g. while verify_load runs
+            self.start_raw_index_build()
+        
+        logger.info("Raw data ingestion completed", results=results)
+        return results
+    
+    def _load_wave(self, jobs: List[Tuple[Path, str]]) -> List[Tuple[int, Optional[str]]]:
+        """
+        Load a wave's files in one transaction on one connection
+        
+        Returns:
+            (rows loaded, error message or None) per job
+        """
+        outcomes = []
+        try:
+            with self._transaction() as conn:
+                for csv_path, table_name in jobs:
+                    outcomes.append((self._load_raw_file(csv_path, table_name, "append", conn=conn), None))
+        except Exception as e:
+            failed = jobs[len(outcomes)][1] if len(outcomes) < len(jobs) else None
+            # Nothing from the wave was committed
+            return [
+                (0, str(e) if table_name == failed else f"rolled back with the failed wave: {e}")
+                for _, table_name in jobs
+            ]
+        return outcomes
+    
+    def _rollback_failed_wave(
+        self,
+        jobs: List[Tuple[Path, str]],
+        outcomes: List[Tuple[int, Optional[str]]]
+    ) -> List[Tuple[int, Optional[str]]]:
+        """
+        Undo a wave whose tables were committed separately, if any failed
+        
+        Every loaded table was emptied before the first wave, so truncating
+        the wave's tables restores their pre-wave state.
+        
+        Returns:
+            The outcomes, marked as rolled back if the wave failed
+        """
+        errors = [error for _, error in outcomes if error is not None]
+        if not errors:
+            return outcomes
+        
+        with self.engine.connect() as conn:
+            conn.execute(text(f"TRUNCATE {', '.join(table_name for _, table_name in jobs)}"))
+            conn.commit()
+        return [
+            (0, error if error is not None else f"rolled back with the failed wave: {errors[0]}")
+            for _, error in outcomes
+        ]
+    
+    async def aload_all_raw_data(self, data_dir: Path = Path("data/raw")) -> dict:
+        """
+        Load all raw CSV files with asyncpg's binary COPY
+        
+        The tables of each LOAD_WAVES wave are copied concurrently over an
+        asyncpg pool, which also runs the DDL; CSV parsing happens in worker
+        threads. Falls back to load_all_raw_data (in a thread) when asyncpg
+        isn't installed.
+        
+        Returns:
+            Dictionary with load statistics
+        """
+        try:
+            import asyncpg
+        except ImportError:
+            logger.warning("asyncpg is not installed; using the synchronous loader")
+            return await asyncio.to_thread(self.load_all_raw_data, data_dir)
+        
+        logger.info("Starting async raw data ingestion", data_dir=str(data_dir))
+        
+        results = {}
+        present = []
+        for table_name in RAW_TABLES:
+            if (data_dir / f"{table_name}.csv").exists():
+                present.append(table_name)
             else:
-                logger.warning(f"CSV file not found: {filename}")
+                logger.warning(f"CSV file not found: {table_name}.csv")
                 results[table_name] = {
                     "status": "skipped",
                     "reason": "file_not_found"
                 }
         
+        dsn = self.engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        
+        async def load_table(pool, table_name: str) -> dict:
+            csv_path = data_dir / f"{table_name}.csv"
+            try:
+                async with pool.acquire() as conn, conn.transaction():
+                    await conn.execute(LOAD_TRANSACTION_SQL)
+                    status = await conn.copy_records_to_table(
+                        table_name,
+                        records=_aiter_raw_rows(csv_path, table_name),
+                        columns=TABLE_SCHEMAS[table_name].names
+                    )
+                # asyncpg returns the "COPY <rows>" status
+                rows_loaded = int(status.split()[-1])
+                logger.info(f"Successfully loaded {rows_loaded} rows into {table_name}")
+                return {
+                    "status": "success",
+                    "rows_loaded": rows_loaded
+                }
+            except Exception as e:
+                logger.error(f"Failed to load {csv_path.name}", error=str(e))
+                return {
+                    "status": "error",
+                    "error": str(e)
+                }
+        
+        async with asyncpg.create_pool(dsn, min_size=1, max_size=ASYNC_POOL_SIZE) as pool:
+            # Create tables first; keys and indexes are added once the data is in
+            await pool.execute(CREATE_RAW_TABLES_SQL)
+            if present:
+                # Foreign keys are dropped, so skipped tables keep their rows
+                await pool.execute(f"TRUNCATE {', '.join(present)}")
+            for wave in LOAD_WAVES:
+                tables = [table for table in wave if table in present]
+                outcomes = await asyncio.gather(*(load_table(pool, table) for table in tables))
+                results.update(zip(tables, outcomes))
+            
+            results = {table: results[table] for table in RAW_TABLES}
+            if any(result["status"] == "error" for result in results.values()):
+                # Partially loaded tables may not satisfy the foreign keys
+                logger.warning("Skipping raw layer constraints after failed loads")
+            else:
+                await pool.execute(RAW_CONSTRAINTS_SQL)
+                # Indexes build in a background thread, e.g. while verify_load runs
+                self.start_raw_index_build()
+        
         logger.info("Raw data ingestion completed", results=results)
         return results
     
@@ -220,27 +1254,45 @@ class PostgresLoader:
         """Verify data was loaded correctly"""
         logger.info("Verifying data load")
         
-        tables = [
-            "raw_patients",
-            "raw_providers",
-            "raw_claims",
-            "raw_notes",
-            "raw_icd10",
-            "raw_cpt"
-        ]
-        
-        verification = {}
+        # Count every table in a single round trip
+        count_sql = " UNION ALL ".join(
+            f"SELECT '{table}' AS table_name, COUNT(*) FROM {table}" for table in RAW_TABLES
+        )
         
         with self.engine.connect() as conn:
-            for table in tables:
-                result = conn.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                count = result.scalar()
-                verification[table] = count
-                logger.info(f"Table {table}: {count} rows")
+            counts = dict(conn.execute(text(count_sql)).all())
+        
+        verification = {}
+        for table in RAW_TABLES:
+            verification[table] = counts[table]
+            logger.info(f"Table {table}: {counts[table]} rows")
         
         return verification
 
 
+def _init_load_worker():
+    """Drop pooled connections inherited from the parent process"""
+    db_manager.get_engine().dispose(close=False)
+
+
+def _load_worker(job: tuple, loader: Optional[PostgresLoader] = None) -> Tuple[int, Optional[str]]:
+    """
+    Load one raw file, in a pool worker or inline
+    
+    Module-level so it can be pickled for ProcessPoolExecutor.
+    
+    Returns:
+        (rows loaded, error message or None)
+    """
+    csv_path, table_name = job
+    if loader is None:
+        loader = PostgresLoader()
+    try:
+        return loader._load_raw_file(csv_path, table_name, if_exists="append"), None
+    except Exception as e:
+        return 0, str(e)
+
+
 if __name__ == "__main__":
     # Test loader
     loader = PostgresLoader()
@@ -253,4 +1305,5 @@ if __name__ == "__main__":
     verification = loader.verify_load()
     for table, count in verification.items():
         print(f"  {table}: {count} rows")
+    loader.wait_for_indexes()
 
@@ -1,14 +1,29 @@
 """
 Schema definitions for healthcare claims data
-Pydantic models for validation and type safety
+Pydantic models for validation and type safety, plus msgspec records
+for the high-volume generation path
 """
 
 from datetime import date, datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from typing import Any, Callable, Iterable, Optional, List, Tuple, get_args
+import msgspec
+import pyarrow as pa
+import pyarrow.compute as pc
+from pydantic import BaseModel, Field, field_validator
 import re
 
 
+# Allowed categorical values, shared by the validators and validate_batch
+VALID_GENDERS = frozenset({'M', 'F', 'O', 'U'})
+VALID_CLAIM_TYPES = frozenset({'INPATIENT', 'OUTPATIENT', 'EMERGENCY', 'AMBULATORY', 'PHYSICIAN'})
+VALID_CLAIM_STATUSES = frozenset({'APPROVED', 'DENIED', 'PENDING', 'PARTIAL', 'REJECTED'})
+VALID_NOTE_TYPES = frozenset({'ADMISSION', 'DISCHARGE', 'PROGRESS', 'PROCEDURE', 'DIAGNOSIS'})
+
+_ZIP3_PATTERN = r'^\d{3}'
+_NPI_PATTERN = r'^\d{10}$'
+_ZIP3_RE = re.compile(_ZIP3_PATTERN)
+
+
 class PatientSchema(BaseModel):
     """Patient demographic data (HIPAA-compliant, de-identified)"""
     patient_id: str = Field(..., description="Unique patient identifier")
@@ -18,14 +33,18 @@ class PatientSchema(BaseModel):
     state: str = Field(..., description="State code (2 letters)")
     created_at: datetime = Field(default_factory=datetime.now)
     
-    @validator('gender')
+    @field_validator('gender')
+    @classmethod
     def validate_gender(cls, v):
-        assert v in ['M', 'F', 'O', 'U'], "Gender must be M, F, O, or U"
+        if v not in VALID_GENDERS:
+            raise ValueError("Gender must be M, F, O, or U")
         return v
     
-    @validator('zip_code')
+    @field_validator('zip_code')
+    @classmethod
     def validate_zip(cls, v):
-        assert re.match(r'^\d{3}', v), "ZIP code must start with 3 digits"
+        if not _ZIP3_RE.match(v):
+            raise ValueError("ZIP code must start with 3 digits")
         return v[:3]
 
 
@@ -42,9 +61,11 @@ class ProviderSchema(BaseModel):
     zip_code: str = Field(..., description="ZIP code")
     created_at: datetime = Field(default_factory=datetime.now)
     
-    @validator('npi')
+    @field_validator('npi')
+    @classmethod
     def validate_npi(cls, v):
-        assert len(v) == 10 and v.isdigit(), "NPI must be 10 digits"
+        if len(v) != 10 or not v.isdigit():
+            raise ValueError("NPI must be 10 digits")
         return v
 
 
@@ -65,21 +86,25 @@ class ClaimSchema(BaseModel):
     primary_procedure_code: Optional[str] = Field(None, description="Primary CPT procedure code")
     created_at: datetime = Field(default_factory=datetime.now)
     
-    @validator('claim_type')
+    @field_validator('claim_type')
+    @classmethod
     def validate_claim_type(cls, v):
-        valid_types = ['INPATIENT', 'OUTPATIENT', 'EMERGENCY', 'AMBULATORY', 'PHYSICIAN']
-        assert v in valid_types, f"Claim type must be one of {valid_types}"
+        if v not in VALID_CLAIM_TYPES:
+            raise ValueError(f"Claim type must be one of {sorted(VALID_CLAIM_TYPES)}")
         return v
     
-    @validator('claim_status')
+    @field_validator('claim_status')
+    @classmethod
     def validate_status(cls, v):
-        valid_statuses = ['APPROVED', 'DENIED', 'PENDING', 'PARTIAL', 'REJECTED']
-        assert v in valid_statuses, f"Status must be one of {valid_statuses}"
+        if v not in VALID_CLAIM_STATUSES:
+            raise ValueError(f"Status must be one of {sorted(VALID_CLAIM_STATUSES)}")
         return v
     
-    @validator('total_charge', 'total_paid')
+    @field_validator('total_charge', 'total_paid')
+    @classmethod
     def validate_amounts(cls, v):
-        assert v >= 0, "Amounts must be non-negative"
+        if v < 0:
+            raise ValueError("Amounts must be non-negative")
         return round(v, 2)
 
 
@@ -91,10 +116,11 @@ class NoteSchema(BaseModel):
     note_text: str = Field(..., description="Clinical note text")
     created_at: datetime = Field(default_factory=datetime.now)
     
-    @validator('note_type')
+    @field_validator('note_type')
+    @classmethod
     def validate_note_type(cls, v):
-        valid_types = ['ADMISSION', 'DISCHARGE', 'PROGRESS', 'PROCEDURE', 'DIAGNOSIS']
-        assert v in valid_types, f"Note type must be one of {valid_types}"
+        if v not in VALID_NOTE_TYPES:
+            raise ValueError(f"Note type must be one of {sorted(VALID_NOTE_TYPES)}")
         return v
 
 
@@ -113,3 +139,129 @@ class CPTSchema(BaseModel):
     category: str = Field(..., description="Category")
     is_valid: bool = Field(True, description="Whether code is currently valid")
 
+
+
+class PatientRecord(msgspec.Struct, kw_only=True, array_like=True, gc=False):
+    """Unvalidated patient row for bulk generation (mirrors PatientSchema)"""
+    patient_id: str
+    date_of_birth: date
+    gender: str
+    zip_code: str
+    state: str
+    created_at: datetime = msgspec.field(default_factory=datetime.now)
+
+
+class ClaimRecord(msgspec.Struct, kw_only=True, array_like=True, gc=False):
+    """Unvalidated claim row for bulk generation (mirrors ClaimSchema)"""
+    claim_id: str
+    patient_id: str
+    provider_id: str
+    claim_date: date
+    admission_date: Optional[date] = None
+    discharge_date: Optional[date] = None
+    claim_type: str
+    total_charge: float
+    total_paid: float
+    claim_status: str
+    denial_reason: Optional[str] = None
+    primary_diagnosis_code: str
+    primary_procedure_code: Optional[str] = None
+    created_at: datetime = msgspec.field(default_factory=datetime.now)
+
+
+class NoteRecord(msgspec.Struct, kw_only=True, array_like=True, gc=False):
+    """Unvalidated clinical note row for bulk generation (mirrors NoteSchema)"""
+    note_id: str
+    claim_id: str
+    note_type: str
+    note_text: str
+    created_at: datetime = msgspec.field(default_factory=datetime.now)
+
+
+def schema_fields(model: type) -> List[Tuple[str, Any]]:
+    """(name, annotation) for each field of a Pydantic model or msgspec record, in order"""
+    if issubclass(model, msgspec.Struct):
+        return [(field.name, field.type) for field in msgspec.structs.fields(model)]
+    return [(name, info.annotation) for name, info in model.model_fields.items()]
+
+
+# Arrow column types for the Python types used in the schemas above
+_ARROW_TYPES = {
+    str: pa.string(),
+    float: pa.float64(),
+    int: pa.int64(),
+    bool: pa.bool_(),
+    date: pa.date32(),
+    datetime: pa.timestamp('us'),
+}
+
+
+def arrow_schema(model: type, dictionary_fields: Iterable[str] = ()) -> pa.Schema:
+    """
+    Arrow schema with one column per model/record field, in field order
+    
+    Args:
+        dictionary_fields: Low-cardinality columns to dictionary-encode (int8 indices)
+    """
+    dictionary_fields = set(dictionary_fields)
+    fields = []
+    for name, annotation in schema_fields(model):
+        # Unwrap Optional[X] to X
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        arrow_type = _ARROW_TYPES[args[0] if args else annotation]
+        if name in dictionary_fields:
+            arrow_type = pa.dictionary(pa.int8(), arrow_type)
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def _is_in(values: frozenset) -> Callable[[pa.Array], pa.Array]:
+    value_set = pa.array(sorted(values))
+    return lambda column: pc.is_in(column, value_set=value_set)
+
+
+def _matches(pattern: str) -> Callable[[pa.Array], pa.Array]:
+    return lambda column: pc.match_substring_regex(column, pattern)
+
+
+def _non_negative(column: pa.Array) -> pa.Array:
+    return pc.greater_equal(column, pa.scalar(0, column.type))
+
+
+# Column-level equivalents of the field validators, for whole-batch checks
+BATCH_CHECKS = {
+    PatientSchema: [
+        ('gender', _is_in(VALID_GENDERS), "Gender must be M, F, O, or U"),
+        ('zip_code', _matches(_ZIP3_PATTERN), "ZIP code must start with 3 digits"),
+    ],
+    ProviderSchema: [
+        ('npi', _matches(_NPI_PATTERN), "NPI must be 10 digits"),
+    ],
+    ClaimSchema: [
+        ('claim_type', _is_in(VALID_CLAIM_TYPES), f"Claim type must be one of {sorted(VALID_CLAIM_TYPES)}"),
+        ('claim_status', _is_in(VALID_CLAIM_STATUSES), f"Status must be one of {sorted(VALID_CLAIM_STATUSES)}"),
+        ('total_charge', _non_negative, "Amounts must be non-negative"),
+        ('total_paid', _non_negative, "Amounts must be non-negative"),
+    ],
+    NoteSchema: [
+        ('note_type', _is_in(VALID_NOTE_TYPES), f"Note type must be one of {sorted(VALID_NOTE_TYPES)}"),
+    ],
+}
+
+
+def validate_batch(batch: pa.RecordBatch, model: type):
+    """
+    Apply a schema's field validators to a whole Arrow batch at once
+    
+    Each rule runs as one Arrow compute kernel over its column rather than
+    per row in Python. Nulls are left to the database's constraints.
+    
+    Raises:
+        ValueError: On the first rule with a failing row
+    """
+    for name, check, message in BATCH_CHECKS.get(model, ()):
+        column = batch.column(name)
+        passed = pc.or_kleene(check(column), pc.is_null(column))
+        if not pc.all(passed).as_py():
+            first_bad = column.filter(pc.invert(passed))[0].as_py()
+            raise ValueError(f"{model.__name__}.{name}: {message} (got {first_bad!r})")
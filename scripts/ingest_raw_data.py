@@ -66,6 +66,9 @@ def main():
         for table, count in verification.items():
             print(f"  {table}: {count:,} rows")
         
+        # Indexes are built in the background while the load is verified
+        loader.wait_for_indexes()
+        
         print("\n✓ Raw data ingestion completed successfully!")
         
     except Exception as e:
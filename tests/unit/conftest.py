@@ -0,0 +1,29 @@
+"""
+Shared fixtures: a small, seeded set of generated records
+"""
+
+import pytest
+
+from ingestion.generators.claim_generator import ClaimGenerator
+from ingestion.generators.patient_generator import PatientGenerator
+from ingestion.generators.provider_generator import ProviderGenerator
+
+DIAGNOSIS_CODES = ['E11.9', 'I10', 'J06.9', 'M25.561']
+PROCEDURE_CODES = ['99213', '99214', '72141']
+
+
+@pytest.fixture(scope="session")
+def patients():
+    return PatientGenerator(seed=7).generate_patients(50)
+
+
+@pytest.fixture(scope="session")
+def providers():
+    return ProviderGenerator(seed=7).generate_providers(10)
+
+
+@pytest.fixture(scope="session")
+def claims(patients, providers):
+    return ClaimGenerator(seed=7).generate_claims(
+        patients, providers, DIAGNOSIS_CODES, PROCEDURE_CODES, claims_per_patient=4
+    )
@@ -0,0 +1,103 @@
+"""
+Tests for the columnar generator paths: Arrow tables against the record
+paths, and the numeric kernels behind them
+"""
+
+import msgspec
+import numpy as np
+import pytest
+
+from ingestion.generators.claim_generator import ClaimGenerator
+from ingestion.generators.patient_generator import PatientGenerator, _build_patient_arrays
+
+from .conftest import DIAGNOSIS_CODES, PROCEDURE_CODES
+
+
+def as_rows(records):
+    """Record dicts without created_at, which is stamped at generation time"""
+    rows = [msgspec.structs.asdict(record) for record in records]
+    for row in rows:
+        del row['created_at']
+    return rows
+
+
+def table_rows(table):
+    return table.drop(['created_at']).to_pylist()
+
+
+@pytest.mark.parametrize("count", [1, 250, 10001])
+def test_patients_arrow_matches_records(count):
+    table = PatientGenerator(seed=21).generate_patients_arrow(count, start_id=500)
+    records = PatientGenerator(seed=21).generate_patients(count, start_id=500)
+    assert table.num_rows == count
+    assert table_rows(table) == as_rows(records)
+
+
+def test_claims_arrow_matches_records(patients, providers):
+    patient_ids = [p.patient_id for p in patients]
+    provider_ids = [p.provider_id for p in providers]
+    table = ClaimGenerator(seed=21).generate_claims_arrow(
+        patient_ids, provider_ids, DIAGNOSIS_CODES, PROCEDURE_CODES, claims_per_patient=3
+    )
+    records = ClaimGenerator(seed=21).generate_claims(
+        patients, providers, DIAGNOSIS_CODES, PROCEDURE_CODES, claims_per_patient=3
+    )
+    assert table.num_rows == len(records) == len(patients) * 3
+    assert table_rows(table) == as_rows(records)
+
+
+def test_build_patient_arrays_bounds():
+    rng = np.random.default_rng(0)
+    gender_p = np.array([0.48, 0.50, 0.01, 0.01])
+    age_days, gender_idx, zip_idx, state_idx = _build_patient_arrays(rng, 20000, 36525, gender_p, 1000, 30)
+
+    assert all(len(column) == 20000 for column in (age_days, gender_idx, zip_idx, state_idx))
+    assert age_days.min() >= 0 and age_days.max() <= 36525
+    assert set(np.unique(gender_idx)) <= {0, 1, 2, 3}
+    assert zip_idx.min() >= 0 and zip_idx.max() < 1000
+    assert state_idx.min() >= 0 and state_idx.max() < 30
+    # Gender frequencies follow the weights
+    assert np.allclose(np.bincount(gender_idx, minlength=4) / 20000, gender_p, atol=0.02)
+
+
+def test_claim_amounts_bounds():
+    generator = ClaimGenerator(seed=0)
+    rng = np.random.default_rng(1)
+    m = 50000
+    type_idx = rng.integers(0, len(generator._claim_types), m)
+    high_risk = rng.random(m) < 0.3
+    total_charge, should_deny, status_idx, total_paid = generator._claim_amounts(
+        type_idx, high_risk, rng.random(m), rng.random(m), rng.random(m), rng.random(m)
+    )
+
+    # Charges stay inside the claim type's range
+    assert np.all(total_charge >= generator._charge_lo[type_idx])
+    assert np.all(total_charge <= generator._charge_hi[type_idx])
+
+    statuses = np.array(generator._statuses)[status_idx]
+    assert np.array_equal(statuses == 'DENIED', should_deny)
+    assert np.all(total_paid >= 0)
+    assert np.all(total_paid <= total_charge)
+    # Only approved and partial claims are paid, within their fraction of the charge
+    assert np.all(total_paid[~np.isin(statuses, ['APPROVED', 'PARTIAL'])] == 0)
+    for status, (lo, hi) in generator.paid_ranges.items():
+        paid = statuses == status
+        assert paid.any()
+        fraction = total_paid[paid] / total_charge[paid]
+        assert np.all(fraction >= lo - 0.01) and np.all(fraction <= hi + 0.01)
+
+
+def test_claim_status_matches_denial_reason(claims):
+    generator = ClaimGenerator()
+    for claim in claims:
+        assert (claim.claim_status == 'DENIED') == (claim.denial_reason is not None)
+        if claim.denial_reason is not None:
+            assert claim.denial_reason in generator._reasons_for(claim.primary_diagnosis_code, claim.claim_type)
+            assert claim.total_paid == 0.0
+        assert claim.total_paid <= claim.total_charge
+        # Only inpatient claims carry a 1-14 day stay
+        if claim.claim_type == 'INPATIENT':
+            assert claim.admission_date == claim.claim_date
+            assert 1 <= (claim.discharge_date - claim.admission_date).days <= 14
+        else:
+            assert claim.admission_date is None and claim.discharge_date is None
@@ -0,0 +1,155 @@
+"""
+Tests for the batched CSV exporter: output matches csv.writer byte for byte,
+and a failing write surfaces to the caller
+"""
+
+import csv
+import io
+import os
+
+import pytest
+
+from ingestion import generate_data
+from ingestion.generate_data import CsvBatchWriter, _writev_all
+from ingestion.schemas import NoteRecord, schema_fields
+
+WRITE_MODES = [False] + ([True] if hasattr(os, 'writev') else [])
+
+NOTES = [
+    NoteRecord(note_id=f"NOTE{i}", claim_id=f"CLM{i}", note_type="PROGRESS", note_text=text)
+    for i, text in enumerate([
+        "plain",
+        "comma, inside",
+        'quoted "word"',
+        "two\nlines",
+        "",
+        "ünïcode",
+    ] * 40)
+]
+
+
+def expected_csv(records) -> bytes:
+    """What csv.writer produces for the records, dates as ISO strings"""
+    fields = [name for name, _ in schema_fields(type(records[0]))]
+    text = io.StringIO(newline='')
+    writer = csv.writer(text)
+    writer.writerow(fields)
+    for record in records:
+        row = [getattr(record, name) for name in fields]
+        writer.writerow([value.isoformat() if hasattr(value, 'isoformat') else value for value in row])
+    return text.getvalue().encode('utf-8')
+
+
+@pytest.fixture(params=WRITE_MODES, ids=lambda writev: "writev" if writev else "write")
+def small_buffers(request, monkeypatch):
+    """Flush every few hundred bytes and cap writev at a few buffers, so every path runs"""
+    monkeypatch.setattr(generate_data, 'USE_WRITEV', request.param)
+    monkeypatch.setattr(generate_data, 'EXPORT_BUFFER_SIZE', 512)
+    monkeypatch.setattr(generate_data, 'WRITEV_MAX_BUFFERS', 3)
+    monkeypatch.setattr(generate_data, 'EXPORT_QUEUE_SIZE', 2)
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 1000])
+def test_records_match_csv_writer(tmp_path, small_buffers, claims, batch_size):
+    path = tmp_path / "raw_claims.csv"
+    with CsvBatchWriter(path, batch_size=batch_size) as writer:
+        writer.write(claims)
+
+    assert writer.count == len(claims)
+    assert path.read_bytes() == expected_csv(claims)
+
+
+def test_quoted_text_matches_csv_writer(tmp_path, small_buffers):
+    path = tmp_path / "raw_notes.csv"
+    with CsvBatchWriter(path, batch_size=5) as writer:
+        passed = list(writer.write_through(NOTES))
+
+    assert passed == NOTES
+    assert path.read_bytes() == expected_csv(NOTES)
+
+
+def test_pydantic_rows_match_csv_writer(tmp_path, small_buffers, providers):
+    path = tmp_path / "raw_providers.csv"
+    with CsvBatchWriter(path, batch_size=3) as writer:
+        writer.write(providers)
+
+    assert path.read_bytes() == expected_csv(providers)
+
+
+def test_empty_stream_writes_nothing(tmp_path):
+    path = tmp_path / "raw_notes.csv"
+    with CsvBatchWriter(path) as writer:
+        writer.write([])
+    assert not path.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, 'writev'), reason="needs os.writev")
+def test_writev_all_resumes_partial_writes(tmp_path, monkeypatch):
+    real_writev = os.writev
+
+    def short_writev(fd, buffers):
+        # Never write more than a few bytes, splitting buffers mid-way
+        return real_writev(fd, [bytes(buffers[0][:3])])
+
+    monkeypatch.setattr(os, 'writev', short_writev)
+    buffers = [b"abcdefg", b"", b"h", b"ijklmnopqrstuvwxyz"]
+    path = tmp_path / "out"
+    with open(path, 'wb', buffering=0) as f:
+        _writev_all(f.fileno(), buffers)
+    assert path.read_bytes() == b"".join(buffers)
+
+
+class FailingFile:
+    """Sink whose writes fail as a full disk would"""
+
+    def __init__(self, *args, **kwargs):
+        self.closed = False
+
+    def fileno(self):
+        return -1
+
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(params=WRITE_MODES, ids=lambda writev: "writev" if writev else "write")
+def failing_sink(request, monkeypatch):
+    opened = []
+
+    def fake_open(*args, **kwargs):
+        opened.append(FailingFile())
+        return opened[-1]
+
+    def failing_writev(fd, buffers):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(generate_data, 'USE_WRITEV', request.param)
+    monkeypatch.setattr(generate_data, 'open', fake_open, raising=False)
+    monkeypatch.setattr(generate_data, '_writev_all', failing_writev)
+    return opened
+
+
+@pytest.mark.parametrize("count", [1, len(NOTES)])
+def test_sink_error_propagates_from_exit(tmp_path, monkeypatch, failing_sink, count):
+    # With tiny buffers the error can also surface on a later flush inside write()
+    monkeypatch.setattr(generate_data, 'EXPORT_BUFFER_SIZE', 64)
+    monkeypatch.setattr(generate_data, 'EXPORT_QUEUE_SIZE', 1)
+
+    with pytest.raises(OSError, match="No space left"):
+        with CsvBatchWriter(tmp_path / "raw_notes.csv", batch_size=2) as writer:
+            writer.write(NOTES[:count])
+
+    # The writer thread was stopped and the file closed either way
+    assert not writer._thread.is_alive()
+    assert failing_sink[0].closed
+
+
+def test_sink_error_propagates_from_close(tmp_path, failing_sink):
+    writer = CsvBatchWriter(tmp_path / "raw_notes.csv")
+    writer.write(NOTES)
+    with pytest.raises(OSError, match="No space left"):
+        writer.close()
+    assert failing_sink[0].closed
@@ -0,0 +1,68 @@
+"""
+Tests for splitting raw CSV files into byte ranges for concurrent COPY
+"""
+
+import csv
+import io
+
+import pytest
+
+from ingestion.loaders.postgres_loader import _split_csv_by_bytes
+
+HEADER = "note_id,claim_id,note_text\n"
+
+ROWS = [
+    '1,CLM1,"Patient seen,\nfollow up in 2 weeks"\n',
+    '2,CLM2,plain text\n',
+    '3,CLM3,"He said ""stop""\nthen left"\n',
+    '4,CLM4,""\n',
+    '5,CLM5,"a ""quoted,\n"" comma\n\nand blank line"\n',
+    '6,CLM6,last\n',
+]
+
+
+@pytest.fixture
+def notes_csv(tmp_path):
+    path = tmp_path / "raw_notes.csv"
+    path.write_bytes((HEADER + "".join(ROWS)).encode("utf-8"))
+    return path
+
+
+def _read_ranges(path, ranges):
+    data = path.read_bytes()
+    return [data[start:end].decode("utf-8") for start, end in ranges]
+
+
+@pytest.mark.parametrize("n_chunks", [1, 2, 3, 4, 6, 7, 50])
+def test_ranges_cover_rows_exactly(notes_csv, n_chunks):
+    ranges = _split_csv_by_bytes(notes_csv, n_chunks)
+
+    assert 1 <= len(ranges) <= max(1, n_chunks)
+    assert ranges[0][0] == len(HEADER)
+    assert ranges[-1][1] == notes_csv.stat().st_size
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+    # Every range is whole records, and together they are all the rows
+    parts = _read_ranges(notes_csv, ranges)
+    per_range = [list(csv.reader(io.StringIO(part, newline=""))) for part in parts]
+    assert all(rows for rows in per_range)
+    assert [row for rows in per_range for row in rows] == list(csv.reader(io.StringIO("".join(ROWS), newline="")))
+
+
+def test_more_chunks_than_rows(notes_csv):
+    ranges = _split_csv_by_bytes(notes_csv, 50)
+    # One range per record at most; a record is never split
+    assert len(ranges) == len(ROWS)
+    assert "".join(_read_ranges(notes_csv, ranges)) == "".join(ROWS)
+
+
+def test_header_only(tmp_path):
+    path = tmp_path / "raw_notes.csv"
+    path.write_text(HEADER)
+    assert _split_csv_by_bytes(path, 4) == []
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "raw_notes.csv"
+    path.write_text("")
+    assert _split_csv_by_bytes(path, 4) == []
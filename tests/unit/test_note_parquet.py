@@ -0,0 +1,36 @@
+"""
+Tests for streaming generated notes to Parquet
+"""
+
+import pyarrow.parquet as pq
+import pytest
+
+from ingestion.generators.note_generator import NoteGenerator
+from ingestion.schemas import NoteRecord, arrow_schema
+
+
+@pytest.mark.parametrize("notes_per_claim, batch_size", [(1, 8192), (2, 7), (3, 1)])
+def test_write_notes_matches_iter_notes(tmp_path, claims, notes_per_claim, batch_size):
+    path = tmp_path / "notes.parquet"
+    written = NoteGenerator(seed=11).write_notes(claims, path, notes_per_claim=notes_per_claim, batch_size=batch_size)
+    expected = list(NoteGenerator(seed=11).iter_notes(claims, notes_per_claim=notes_per_claim, batch_size=batch_size))
+
+    table = pq.read_table(path)
+    assert written == len(expected) == len(claims) * notes_per_claim
+    assert table.schema.equals(arrow_schema(NoteRecord))
+
+    # created_at is the write time, so only the generated columns are compared
+    columns = ['note_id', 'claim_id', 'note_type', 'note_text']
+    assert table.select(columns).to_pylist() == [
+        {name: getattr(note, name) for name in columns} for note in expected
+    ]
+    assert table.column('created_at').null_count == 0
+
+
+def test_write_notes_row_groups(tmp_path, claims):
+    path = tmp_path / "notes.parquet"
+    NoteGenerator(seed=11).write_notes(claims, path, batch_size=64)
+    metadata = pq.ParquetFile(path).metadata
+    sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    assert sizes[:-1] == [64] * (len(sizes) - 1)
+    assert sum(sizes) == len(claims)
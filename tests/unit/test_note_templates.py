@@ -0,0 +1,98 @@
+"""
+Tests for the specialized note formatters: every note type under every
+denial / procedure / admission combination
+"""
+
+import itertools
+import re
+from datetime import date
+
+import pytest
+
+from ingestion.generators.note_generator import NoteGenerator, _DENIAL_EXPLANATIONS
+from ingestion.schemas import ClaimRecord
+
+UNFILLED = re.compile(r"%\(\w+\)s|\{\w+\}")
+
+COMBINATIONS = list(itertools.product([False, True], repeat=3))
+
+
+def make_claim(has_denial: bool, has_procedure: bool, has_admission: bool) -> ClaimRecord:
+    return ClaimRecord(
+        claim_id="CLM1000001",
+        patient_id="PAT100001",
+        provider_id="PROV10001",
+        claim_date=date(2025, 3, 15),
+        admission_date=date(2025, 3, 10) if has_admission else None,
+        discharge_date=date(2025, 3, 14) if has_admission else None,
+        claim_type="INPATIENT" if has_admission else "OUTPATIENT",
+        total_charge=12345.6,
+        total_paid=0.0 if has_denial else 9876.5,
+        claim_status="DENIED" if has_denial else "APPROVED",
+        denial_reason="TIMELY_FILING" if has_denial else None,
+        primary_diagnosis_code="I10",
+        primary_procedure_code="99213" if has_procedure else None,
+    )
+
+
+def render(note_type: str, claim: ClaimRecord) -> str:
+    generator = NoteGenerator(seed=3)
+    draws = generator._draw_batch(1)[0]
+    method = {
+        'ADMISSION': generator.generate_admission_note,
+        'DISCHARGE': generator.generate_discharge_note,
+        'PROGRESS': generator.generate_progress_note,
+        'PROCEDURE': generator.generate_procedure_note,
+        'DENIAL': generator.generate_denial_note,
+    }[note_type]
+    return method(claim, draws)
+
+
+@pytest.mark.parametrize("note_type", ['ADMISSION', 'DISCHARGE', 'PROGRESS', 'PROCEDURE', 'DENIAL'])
+@pytest.mark.parametrize("has_denial, has_procedure, has_admission", COMBINATIONS)
+def test_note_sections(note_type, has_denial, has_procedure, has_admission):
+    claim = make_claim(has_denial, has_procedure, has_admission)
+    text = render(note_type, claim)
+    explanation = _DENIAL_EXPLANATIONS["TIMELY_FILING"]
+
+    assert not UNFILLED.search(text), text
+    assert "None" not in text
+    assert "I10" in text
+
+    if note_type == 'DENIAL' and not has_denial:
+        # Without a denial reason a progress note is written instead
+        assert text.startswith("PROGRESS NOTE - 2025-03-15")
+        return
+
+    if note_type == 'DENIAL':
+        assert text.startswith("CLAIM DENIAL NOTICE - 2025-03-15")
+        assert f"DENIAL REASON:\n{explanation}" in text
+        assert "Total Charge: $12,345.60" in text
+        assert "CLAIM STATUS:" not in text
+        assert (", Procedure: CPT 99213" in text) == has_procedure
+        assert text.count("Diagnosis: I10") == 2
+        return
+
+    assert (f"CLAIM STATUS:\nThis claim was denied. Reason: {explanation}" in text) == has_denial
+    assert ("CLAIM STATUS:" in text) == has_denial
+
+    if note_type == 'ADMISSION':
+        admitted = "2025-03-10" if has_admission else "2025-03-15"
+        assert f"Patient admitted on {admitted}." in text
+        assert "VITAL SIGNS:\nBP " in text
+    elif note_type == 'DISCHARGE':
+        discharged = "2025-03-14" if has_admission else "2025-03-15"
+        assert f"Patient discharged on {discharged}." in text
+        assert (" Procedure performed: CPT 99213." in text) == has_procedure
+    elif note_type == 'PROGRESS':
+        assert text.startswith("PROGRESS NOTE - 2025-03-15")
+        assert "Vital signs: Vitals: " in text
+    elif note_type == 'PROCEDURE':
+        assert f"CPT Code: {'99213' if has_procedure else 'N/A'}" in text
+
+
+def test_generated_notes_have_no_placeholders(claims):
+    notes = list(NoteGenerator(seed=5).iter_notes(claims, notes_per_claim=3))
+    assert notes
+    for note in notes:
+        assert not UNFILLED.search(note.note_text), note.note_text
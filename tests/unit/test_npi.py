@@ -0,0 +1,51 @@
+"""
+Tests for NPI Luhn check digits in the provider generator
+"""
+
+import numpy as np
+import pytest
+
+from ingestion.generators.provider_generator import LUHN_DOUBLE, ProviderGenerator, _npi_check_digits
+
+
+def luhn_valid(number: str) -> bool:
+    """Scalar Luhn check over a full number (check digit last)"""
+    total = 0
+    for i, char in enumerate(reversed(number)):
+        digit = int(char)
+        if i % 2 == 1:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+
+def scalar_check_digit(base: str) -> int:
+    """Check digit for 9 NPI base digits, computed with the "80840" prefix"""
+    return next(check for check in range(10) if luhn_valid(f"80840{base}{check}"))
+
+
+def test_luhn_double():
+    assert LUHN_DOUBLE.tolist() == [0, 2, 4, 6, 8, 1, 3, 5, 7, 9]
+
+
+@pytest.mark.parametrize("npi", ["1234567893", "1245319599", "1003000126", "1497758544"])
+def test_known_valid_npis(npi):
+    digits = np.array([[int(char) for char in npi[:9]]], dtype=np.int8)
+    assert _npi_check_digits(digits)[0] == int(npi[9])
+
+
+def test_matches_scalar_luhn():
+    rng = np.random.default_rng(0)
+    digits = rng.integers(0, 10, size=(5000, 9), dtype=np.int8)
+    expected = [scalar_check_digit("".join(map(str, row))) for row in digits.tolist()]
+    assert _npi_check_digits(digits).tolist() == expected
+
+
+def test_generated_npis_are_valid():
+    generator = ProviderGenerator(seed=42)
+    npis = generator.generate_npis(1000) + [generator.generate_npi() for _ in range(100)]
+    for npi in npis:
+        assert len(npi) == 10 and npi[0] in "12"
+        assert luhn_valid(f"80840{npi}"), npi
@@ -0,0 +1,138 @@
+"""
+Golden-byte tests for the binary COPY encoders in the Postgres loader
+"""
+
+import datetime as dt
+import random
+import struct
+from decimal import Decimal
+
+import pyarrow as pa
+import pytest
+
+from ingestion.loaders.postgres_loader import (
+    PGCOPY_HEADER,
+    PGCOPY_TRAILER,
+    PostgresLoader,
+    _encode_bool,
+    _encode_date,
+    _encode_numeric,
+    _encode_text,
+    _encode_timestamp,
+    _numeric_from_unscaled,
+    _numeric_send,
+)
+
+NULL = b"\xff\xff\xff\xff"
+
+
+class FakeCursor:
+    """Records what copy_expert was sent"""
+
+    def copy_expert(self, sql, f):
+        self.sql = sql
+        self.data = f.read()
+
+
+def test_header_and_trailer():
+    assert PGCOPY_HEADER == b"PGCOPY\n\xff\r\n\x00" + b"\x00" * 8
+    assert PGCOPY_TRAILER == b"\xff\xff"
+
+
+@pytest.mark.parametrize("value, expected", [
+    # ndigits, weight, sign, dscale, then base-10000 digits
+    ("123.45", "0000000c" "0002" "0000" "0000" "0002" "007b" "1194"),
+    ("-0.05", "0000000a" "0001" "ffff" "4000" "0002" "01f4"),
+    ("10000", "0000000a" "0001" "0001" "0000" "0000" "0001"),
+    ("0.00", "00000008" "0000" "0000" "0000" "0002"),
+    ("0", "00000008" "0000" "0000" "0000" "0000"),
+])
+def test_numeric_send(value, expected):
+    assert _numeric_send(value) == bytes.fromhex(expected)
+
+
+def _sample_unscaled(scale):
+    """Edge cases plus a fixed random sample of unscaled values up to 18 digits"""
+    rng = random.Random(scale)
+    edges = [0, 1, -1, 9999, 10000, -10000, 10 ** 18 - 1, -(10 ** 18 - 1)]
+    return edges + [rng.randint(-(10 ** rng.randint(1, 18)), 10 ** rng.randint(1, 18)) for _ in range(4000)]
+
+
+@pytest.mark.parametrize("scale", [0, 1, 2, 4, 7])
+def test_numeric_from_unscaled_matches_numeric_send(scale):
+    # A string carrying every digit of the scale gets the same dscale
+    for unscaled in _sample_unscaled(scale):
+        value = str(Decimal(unscaled).scaleb(-scale))
+        assert _numeric_from_unscaled(unscaled, scale) == _numeric_send(value), value
+
+
+def test_numeric_dscale():
+    # Same digits; only the dscale field (last header word) differs
+    short, padded = _numeric_send("1.5"), _numeric_from_unscaled(150, 2)
+    assert short[10:12] == b"\x00\x01"
+    assert padded[10:12] == b"\x00\x02"
+    assert short[:10] + short[12:] == padded[:10] + padded[12:]
+
+
+def test_encode_numeric():
+    values = pa.array([None, Decimal("123.45"), Decimal("-0.05")], pa.decimal128(12, 2))
+    assert _encode_numeric(values) == [
+        NULL,
+        bytes.fromhex("0000000c" "0002" "0000" "0000" "0002" "007b" "1194"),
+        bytes.fromhex("0000000a" "0001" "ffff" "4000" "0002" "01f4"),
+    ]
+
+
+def test_encode_date():
+    values = pa.array([dt.date(2000, 1, 2), None, dt.date(1999, 12, 31)], pa.date32())
+    assert _encode_date(values) == [
+        bytes.fromhex("00000004" "00000001"),
+        NULL,
+        bytes.fromhex("00000004" "ffffffff"),
+    ]
+
+
+def test_encode_timestamp():
+    values = pa.array([dt.datetime(2000, 1, 1, 0, 0, 1), None, dt.datetime(1999, 12, 31, 23, 59, 59, 999999)], pa.timestamp('us'))
+    assert _encode_timestamp(values) == [
+        bytes.fromhex("00000008" "00000000000f4240"),
+        NULL,
+        bytes.fromhex("00000008" "ffffffffffffffff"),
+    ]
+
+
+def test_encode_text():
+    values = pa.array(["héllo", None, ""], pa.string())
+    assert _encode_text(values) == [
+        bytes.fromhex("00000006") + "héllo".encode('utf-8'),
+        NULL,
+        bytes.fromhex("00000000"),
+    ]
+
+
+def test_encode_bool():
+    values = pa.array([True, None, False], pa.bool_())
+    assert _encode_bool(values) == [
+        bytes.fromhex("00000001" "01"),
+        NULL,
+        bytes.fromhex("00000001" "00"),
+    ]
+
+
+def test_write_binary_copy():
+    batch = pa.record_batch(
+        [pa.array(["CLM1"]), pa.array([dt.date(2000, 1, 2)], pa.date32()), pa.array([None], pa.string())],
+        names=["claim_id", "service_date", "notes"]
+    )
+    cur = FakeCursor()
+    PostgresLoader._write_binary_copy(batch, cur, "raw_claims")
+
+    assert cur.sql == "COPY raw_claims (claim_id,service_date,notes) FROM STDIN WITH (FORMAT BINARY)"
+    assert cur.data == (
+        PGCOPY_HEADER
+        + struct.pack(">h", 3)
+        + bytes.fromhex("00000004") + b"CLM1"
+        + bytes.fromhex("00000004" "00000001")
+        + NULL
+        + PGCOPY_TRAILER
+    )